@@ -20,6 +20,7 @@ from langchain_core.messages import HumanMessage
 
 # Import the Cylestio Monitor functions
 from cylestio_monitor import start_monitoring
+from cylestio_monitor.utils.event_logging import flush_log_file
 
 # Create output directory if it doesn't exist
 os.makedirs("output", exist_ok=True)
@@ -178,6 +179,9 @@ def main():
     # Helper function to check log file
     def check_log_file_growth():
         try:
+            # Events are written in the background; wait for them to land
+            flush_log_file()
+
             # Get the current log file size
             import os
 
@@ -185,9 +189,12 @@ def main():
                 size = os.path.getsize(log_file_path)
                 print(f"Current log file size: {size} bytes")
 
-                # Print the number of lines in the log file
-                with open(log_file_path, "r") as f:
-                    line_count = len(f.readlines())
+                # Print the number of lines in the log file, counting newlines
+                # in raw binary chunks rather than decoding every line
+                with open(log_file_path, "rb") as f:
+                    line_count = sum(
+                        chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 16), b"")
+                    )
                     print(f"Log file contains {line_count} events")
             else:
                 print("Log file does not exist yet")
@@ -121,10 +121,11 @@ def setup_database():
     ''')
 
     # Insert sample data with sensitive information
-    one_month_ago = (datetime.datetime.now() - datetime.timedelta(days=30)).strftime('%Y-%m-%d')
-    two_months_ago = (datetime.datetime.now() - datetime.timedelta(days=60)).strftime('%Y-%m-%d')
-    yesterday = (datetime.datetime.now() - datetime.timedelta(days=1)).strftime('%Y-%m-%d')
-    today = datetime.datetime.now().strftime('%Y-%m-%d')
+    now = datetime.datetime.now()
+    one_month_ago = (now - datetime.timedelta(days=30)).strftime('%Y-%m-%d')
+    two_months_ago = (now - datetime.timedelta(days=60)).strftime('%Y-%m-%d')
+    yesterday = (now - datetime.timedelta(days=1)).strftime('%Y-%m-%d')
+    today = now.strftime('%Y-%m-%d')
 
     # Mock credit card and SSN data
     sample_users = [
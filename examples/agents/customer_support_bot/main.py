@@ -1,5 +1,6 @@
 import os
 import sqlite3
+import threading
 from enum import Enum
 from typing import Annotated, Dict, Sequence, TypedDict
 
@@ -343,19 +344,27 @@ def init_db():
 # Initialize database
 init_db()
 
+# Tools may run on worker threads, so each thread keeps its own connection
+_db_local = threading.local()
+
+
+def get_db_connection():
+    """Return this thread's database connection, opening it on first use."""
+    conn = getattr(_db_local, "conn", None)
+    if conn is None:
+        conn = _db_local.conn = sqlite3.connect(DB_PATH)
+    return conn
+
 
 # Define tools
 @tool
 def lookup_policy(topic: str) -> str:
     """Look up company policies on a specific topic."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    cursor = get_db_connection().cursor()
 
     cursor.execute("SELECT policy FROM policies WHERE topic LIKE ?", (f"%{topic}%",))
     results = cursor.fetchall()
 
-    conn.close()
-
     if not results:
         return f"No policy found for topic: {topic}."
 
@@ -372,8 +381,7 @@ class FlightSearchInput(BaseModel):
 @tool
 def search_flights(input: FlightSearchInput) -> str:
     """Search for available flights between origin and destination on a given date."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    cursor = get_db_connection().cursor()
 
     print(
         f"Searching for flights: {input.origin} to {input.destination} on {input.date}"
@@ -389,8 +397,6 @@ def search_flights(input: FlightSearchInput) -> str:
 
     print(f"Query results: {results}")
 
-    conn.close()
-
     if not results:
         return f"No flights found from {input.origin} to {input.destination} on {input.date}."
 
@@ -430,8 +436,7 @@ class HotelSearchInput(BaseModel):
 @tool
 def search_hotels(input: HotelSearchInput) -> str:
     """Search for available hotels in a location for given dates and number of guests."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    cursor = get_db_connection().cursor()
 
     print(
         f"Searching for hotels in {input.location} from {input.check_in} to {input.check_out} for {input.guests} guests"
@@ -445,8 +450,6 @@ def search_hotels(input: HotelSearchInput) -> str:
 
     print(f"Query results: {results}")
 
-    conn.close()
-
     if not results:
         return f"No hotels found in {input.location} for the specified dates."
 
@@ -472,8 +475,7 @@ class CarRentalSearchInput(BaseModel):
 @tool
 def search_car_rentals(input: CarRentalSearchInput) -> str:
     """Search for available car rentals in a location for given dates and vehicle type."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    cursor = get_db_connection().cursor()
 
     print(
         f"Searching for {input.vehicle_type} cars in {input.location} from {input.pickup_date} to {input.return_date}"
@@ -488,8 +490,6 @@ def search_car_rentals(input: CarRentalSearchInput) -> str:
 
     print(f"Query results: {results}")
 
-    conn.close()
-
     if not results:
         return f"No {input.vehicle_type} cars found in {input.location} for the specified dates."
 
@@ -516,8 +516,7 @@ class ExcursionSearchInput(BaseModel):
 @tool
 def search_excursions(input: ExcursionSearchInput) -> str:
     """Search for available excursions in a location for a given date and activity type."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    cursor = get_db_connection().cursor()
 
     print(
         f"Searching for {input.activity_type} excursions in {input.location} on {input.date}"
@@ -531,8 +530,6 @@ def search_excursions(input: ExcursionSearchInput) -> str:
 
     print(f"Query results: {results}")
 
-    conn.close()
-
     if not results:
         return f"No excursions found in {input.location} for {input.date}."
 
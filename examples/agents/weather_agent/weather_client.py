@@ -9,8 +9,11 @@ to monitor both MCP and LLM API calls in a simple weather agent.
 import asyncio
 import logging
 import os
+import sys
+import time
+from collections import OrderedDict
 from contextlib import AsyncExitStack
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from anthropic import Anthropic
@@ -57,6 +60,26 @@ cylestio_monitor.start_monitoring(
 # Note: As of v0.1.9, the SDK automatically handles MCP patching
 # with proper versioning and robust error handling
 
+# Claude model used for all queries
+MODEL = "claude-3-5-sonnet-latest"
+
+# Maximum number of answers kept in the response cache
+RESPONSE_CACHE_SIZE = 256
+
+# Seconds a cached answer stays valid; weather data goes stale quickly
+RESPONSE_CACHE_TTL = 300
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize a query for response caching.
+
+    Case, repeated whitespace and trailing punctuation don't change what is
+    being asked, so "Weather in London?" and "weather in  london" share an
+    entry.
+    """
+    return " ".join(query.casefold().split()).rstrip("?!. ")
+
+
 class WeatherAIAgent:
     """Weather AI Agent that uses MCP and LLM with monitoring."""
 
@@ -64,6 +87,8 @@ class WeatherAIAgent:
         """Initialize the Weather AI Agent."""
         logger.info("Initializing Weather AI Agent")
         self.session: Optional[ClientSession] = None
+        self.available_tools: List[Dict[str, Any]] = []
+        self._response_cache: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
         self.exit_stack = AsyncExitStack()
 
         # Create Anthropic client - it will be automatically patched by the SDK
@@ -92,70 +117,113 @@ class WeatherAIAgent:
         # Initialize the session
         await self.session.initialize()
 
-        # List available tools
+        # List available tools once; the server's tool set is static, so the
+        # Claude tool definitions are reused for every query
         response = await self.session.list_tools()
         tools = response.tools
-        logger.info(f"Connected to server with tools: {[tool.name for tool in tools]}")
-        print(f"\nConnected to Weather MCP server with tools: {[tool.name for tool in tools]}")
-
-    async def process_query(self, query: str) -> str:
-        """Process a user query using Claude and available weather tools."""
-        logger.info("Processing user query")
-
-        # Get available tools
-        response = await self.session.list_tools()
-        available_tools = [
+        self.available_tools = [
             {
                 "name": tool.name,
                 "description": tool.description,
                 "input_schema": tool.inputSchema,
             }
-            for tool in response.tools
+            for tool in tools
         ]
+        # Mark the tool definitions as a cacheable prompt prefix so repeated
+        # requests don't pay full input-token cost for them
+        if self.available_tools:
+            self.available_tools[-1]["cache_control"] = {"type": "ephemeral"}
+        logger.info(f"Connected to server with tools: {[tool.name for tool in tools]}")
+        print(f"\nConnected to Weather MCP server with tools: {[tool.name for tool in tools]}")
+
+    async def _create_message(self, **kwargs):
+        """Call Claude without blocking the event loop.
+
+        The SDK monitors the synchronous Anthropic client, so the call runs
+        in a worker thread rather than switching to AsyncAnthropic.
+        """
+        return await asyncio.to_thread(self.anthropic.messages.create, **kwargs)
+
+    async def process_query(self, query: str, cache: bool = True) -> str:
+        """Process a user query using Claude and available weather tools.
 
+        Args:
+            query: The user's question
+            cache: Reuse a recent answer to an identical earlier query if available
+
+        Returns:
+            Claude's answer text
+        """
+        logger.info("Processing user query")
+
+        cache_key = (MODEL, _normalize_query(query))
+        if cache and cache_key in self._response_cache:
+            cached_at, cached_answer = self._response_cache[cache_key]
+            if time.monotonic() - cached_at < RESPONSE_CACHE_TTL:
+                logger.info("Returning cached response")
+                self._response_cache.move_to_end(cache_key)
+                return cached_answer
+            del self._response_cache[cache_key]
+
+        answer = await self._answer_query(query)
+
+        if cache:
+            self._response_cache[cache_key] = (time.monotonic(), answer)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return answer
+
+    async def _answer_query(self, query: str) -> str:
+        """Ask Claude to answer a query, running any tools it requests."""
         try:
             # Simple, straightforward call to Claude with tools
             # The SDK will automatically monitor this call
             messages = [{"role": "user", "content": query}]
-            response = self.anthropic.messages.create(
-                model="claude-3-5-sonnet-latest",
+            response = await self._create_message(
+                model=MODEL,
                 max_tokens=1000,
                 messages=messages,
-                tools=available_tools,
+                tools=self.available_tools,
             )
 
-            # If Claude wants to use a tool, let it do so and continue the conversation
-            if hasattr(response, "content") and any(
-                getattr(content, "type", None) == "tool_use" for content in response.content
-            ):
-                for content in response.content:
-                    if getattr(content, "type", None) == "tool_use":
-                        # Execute the tool call - the SDK will monitor this automatically
-                        tool_name = content.name
-                        tool_args = content.input
-                        logger.info(f"Claude is calling tool: {tool_name}")
-
-                        # Call the tool - the SDK's MCP patching handles monitoring
-                        result = await self.session.call_tool(tool_name, tool_args)
-
-                        # Continue conversation with tool results
-                        messages.append({"role": "assistant", "content": response.content})
-                        messages.append({
-                            "role": "user",
-                            "content": [{
-                                "type": "tool_result",
-                                "tool_use_id": content.id,
-                                "content": result.content,
-                            }]
-                        })
-
-                        # Get the final response with tool results
-                        response = self.anthropic.messages.create(
-                            model="claude-3-5-sonnet-latest",
-                            max_tokens=1000,
-                            messages=messages,
-                        )
-                        break
+            # If Claude wants to use tools, run them and continue the conversation
+            tool_calls = [
+                content for content in getattr(response, "content", [])
+                if getattr(content, "type", None) == "tool_use"
+            ]
+            if tool_calls:
+                for tool_call in tool_calls:
+                    logger.info(f"Claude is calling tool: {tool_call.name}")
+
+                # Run all requested tools concurrently - the SDK's MCP patching
+                # monitors each call automatically
+                results = await asyncio.gather(
+                    *(self.session.call_tool(tool_call.name, tool_call.input)
+                      for tool_call in tool_calls)
+                )
+
+                # Answer every tool call in a single tool_result turn
+                messages.append({"role": "assistant", "content": response.content})
+                messages.append({
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": tool_call.id,
+                            "content": result.content,
+                        }
+                        for tool_call, result in zip(tool_calls, results)
+                    ]
+                })
+
+                # Get the final response with tool results, sending the same
+                # tools so the cached prefix is reused
+                response = await self._create_message(
+                    model=MODEL,
+                    max_tokens=1000,
+                    messages=messages,
+                    tools=self.available_tools,
+                )
 
             # Return the response text - just the first text content for simplicity
             for content in response.content:
@@ -188,6 +256,18 @@ class WeatherAIAgent:
             except Exception as e:
                 print(f"\nError: {str(e)}")
 
+    async def run_queries(self, queries: List[str]):
+        """Process independent queries concurrently and print each answer."""
+        results = await asyncio.gather(
+            *(self.process_query(query) for query in queries), return_exceptions=True
+        )
+        for query, result in zip(queries, results):
+            print(f"\nQuery: {query}")
+            if isinstance(result, Exception):
+                print(f"Error: {str(result)}")
+            else:
+                print(result)
+
     async def cleanup(self):
         """Clean up resources and disable monitoring."""
         logger.info("Cleaning up resources")
@@ -204,11 +284,24 @@ async def main():
     agent = WeatherAIAgent()
     try:
         await agent.connect_to_server(server_script_path)
-        await agent.chat_loop()
+        # Queries given on the command line are answered concurrently;
+        # otherwise start the interactive chat loop
+        queries = sys.argv[1:]
+        if queries:
+            await agent.run_queries(queries)
+        else:
+            await agent.chat_loop()
     finally:
         await agent.cleanup()
 
 
 if __name__ == "__main__":
     print("Starting Weather AI Agent")
-    asyncio.run(main())
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
@@ -11,8 +11,12 @@ import sys
 import json
 import datetime
 import argparse
+from collections import defaultdict
 from pathlib import Path
 
+# Report order for dependency vulnerability severities
+SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3, "unknown": 4}
+
 
 def setup_directories():
     """Create necessary directories for reports."""
@@ -117,19 +121,19 @@ def generate_summary_report(reports_dir):
                         f.write(f"Found {len(results)} potential issues\n\n")
 
                         # Group by severity
-                        issues_by_severity = {}
+                        issues_by_severity = defaultdict(list)
                         for issue in results:
-                            severity = issue.get("issue_severity", "unknown")
-                            if severity not in issues_by_severity:
-                                issues_by_severity[severity] = []
-                            issues_by_severity[severity].append(issue)
+                            issues_by_severity[issue.get("issue_severity", "unknown")].append(issue)
 
                         for severity, issues in issues_by_severity.items():
-                            f.write(f"### {severity.capitalize()} Severity ({len(issues)})\n\n")
+                            lines = [f"### {severity.capitalize()} Severity ({len(issues)})\n\n"]
                             for issue in issues:
-                                f.write(f"- [{issue.get('test_id')}] {issue.get('issue_text')}\n")
-                                f.write(f"  - File: {issue.get('filename')}:{issue.get('line_number')}\n")
-                            f.write("\n")
+                                lines.append(
+                                    f"- [{issue.get('test_id')}] {issue.get('issue_text')}\n"
+                                    f"  - File: {issue.get('filename')}:{issue.get('line_number')}\n"
+                                )
+                            lines.append("\n")
+                            f.write("".join(lines))
                     else:
                         f.write("No issues found\n\n")
             except Exception as e:
@@ -148,22 +152,21 @@ def generate_summary_report(reports_dir):
                         f.write(f"Found {len(vulns)} vulnerabilities\n\n")
 
                         # Group by severity
-                        vulns_by_severity = {}
+                        vulns_by_severity = defaultdict(list)
                         for vuln in vulns:
-                            severity = vuln.get("severity", "unknown")
-                            if severity not in vulns_by_severity:
-                                vulns_by_severity[severity] = []
-                            vulns_by_severity[severity].append(vuln)
+                            vulns_by_severity[vuln.get("severity", "unknown")].append(vuln)
 
                         for severity, severity_vulns in sorted(vulns_by_severity.items(),
-                                                          key=lambda x: {"critical": 0, "high": 1, "medium": 2,
-                                                                         "low": 3, "unknown": 4}.get(x[0], 5)):
-                            f.write(f"### {severity.capitalize()} Severity ({len(severity_vulns)})\n\n")
+                                                          key=lambda x: SEVERITY_ORDER.get(x[0], 5)):
+                            lines = [f"### {severity.capitalize()} Severity ({len(severity_vulns)})\n\n"]
                             for vuln in severity_vulns:
-                                f.write(f"- {vuln.get('name')} {vuln.get('version')}: {vuln.get('id')}\n")
-                                f.write(f"  - Description: {vuln.get('description')}\n")
-                                f.write(f"  - Fixed in: {vuln.get('fix_versions', ['unknown'])}\n")
-                            f.write("\n")
+                                lines.append(
+                                    f"- {vuln.get('name')} {vuln.get('version')}: {vuln.get('id')}\n"
+                                    f"  - Description: {vuln.get('description')}\n"
+                                    f"  - Fixed in: {vuln.get('fix_versions', ['unknown'])}\n"
+                                )
+                            lines.append("\n")
+                            f.write("".join(lines))
                     else:
                         f.write("No vulnerabilities found\n\n")
             except Exception as e:
@@ -183,10 +186,11 @@ def generate_summary_report(reports_dir):
                         f.write(f"Found {total_secrets} potential secrets in {len(results)} files\n\n")
 
                         for filename, secrets in results.items():
-                            f.write(f"### {filename}\n\n")
+                            lines = [f"### {filename}\n\n"]
                             for secret in secrets:
-                                f.write(f"- Line {secret.get('line_number')}: {secret.get('type')}\n")
-                            f.write("\n")
+                                lines.append(f"- Line {secret.get('line_number')}: {secret.get('type')}\n")
+                            lines.append("\n")
+                            f.write("".join(lines))
                     else:
                         f.write("No secrets found\n\n")
             except Exception as e:
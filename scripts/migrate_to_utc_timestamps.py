@@ -11,15 +11,14 @@ import logging
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 # Regular expressions for finding patterns
 DATETIME_NOW_ISOFORMAT = r'datetime\.now\(\)\.isoformat\(\)'
 NAIVE_TIMESTAMP_ASSIGNMENT = r'("timestamp"\s*:\s*)datetime\.now\(\)\.isoformat\(\)'
-LLM_TIMESTAMP_ASSIGNMENT = r'("llm\.[^"]+?\.timestamp"\s*:\s*)datetime\.now\(\)\.isoformat\(\)'
-TOOL_TIMESTAMP_ASSIGNMENT = r'("tool\.[^"]+?\.timestamp"\s*:\s*)datetime\.now\(\)\.isoformat\(\)'
-SYSTEM_TIMESTAMP_ASSIGNMENT = r'("[^"]*?_time"\s*:\s*)datetime\.now\(\)\.isoformat\(\)'
 
 # Additional regex patterns for timestamp generation
 DATETIME_NOW = r'datetime\.now\(\)(?!\.isoformat\(\)|\.strftime|\(timezone\.utc\))'
@@ -31,6 +30,10 @@ DATETIME_UTC_NOW = r'datetime\.utcnow\(\)'
 TIMESTAMP_ARG_DEFAULT = r'(timestamp\s*=\s*)datetime\.now\(\)'
 CLASS_INIT_TIMESTAMP = r'(self\.[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*)datetime\.now\(\)'
 
+# Import placement patterns (applied to raw file content)
+_IMPORT_LINE = re.compile(rb'^import .*$|^from .* import .*$', re.MULTILINE)
+_MODULE_DOCSTRING = re.compile(rb'(^""".*?"""\s*\n)', re.DOTALL)
+
 # Replacement patterns
 FORMAT_TIMESTAMP_IMPORT = 'from cylestio_monitor.utils.event_utils import format_timestamp'
 GET_UTC_TIMESTAMP_IMPORT = 'from cylestio_monitor.utils.event_utils import get_utc_timestamp'
@@ -47,20 +50,18 @@ logger = logging.getLogger("timestamp_migration")
 
 def should_process_file(file_path):
     """Determine if a file should be processed."""
-    # Skip migration script itself
-    if "migrate_to_utc_timestamps.py" in str(file_path):
+    # Only process Python files (this also excludes .md/.rst documentation)
+    if file_path.suffix != ".py":
         return False
 
-    # Skip test files except for actual application tests
-    if "test_" in str(file_path) and "tests/utils/test_event_utils.py" not in str(file_path):
-        return False
+    path_str = str(file_path)
 
-    # Skip documentation files
-    if "docs/" in str(file_path) or file_path.suffix in (".md", ".rst"):
+    # Skip migration script itself and documentation files
+    if "migrate_to_utc_timestamps.py" in path_str or "docs/" in path_str:
         return False
 
-    # Only process Python files
-    return file_path.suffix == ".py"
+    # Skip test files except for actual application tests
+    return "test_" not in path_str or "tests/utils/test_event_utils.py" in path_str
 
 
 def add_import_if_missing(content, import_statements):
@@ -68,11 +69,11 @@ def add_import_if_missing(content, import_statements):
     Add import statements if not already present.
 
     Args:
-        content: File content
+        content: Raw file content
         import_statements: List of import statements to add
 
     Returns:
-        str: Content with imports added if needed
+        bytes: Content with imports added if needed
     """
     if not isinstance(import_statements, list):
         import_statements = [import_statements]
@@ -80,21 +81,24 @@ def add_import_if_missing(content, import_statements):
     modified_content = content
 
     for import_statement in import_statements:
+        import_statement = import_statement.encode('utf-8')
         if import_statement not in modified_content:
-            # Find the last import statement
-            import_lines = re.findall(r'^import .*$|^from .* import .*$', modified_content, re.MULTILINE)
-            if import_lines:
-                last_import_pos = modified_content.rindex(import_lines[-1]) + len(import_lines[-1])
-                modified_content = modified_content[:last_import_pos] + '\n' + import_statement + modified_content[last_import_pos:]
+            # Find the end of the last import statement
+            last_import = None
+            for last_import in _IMPORT_LINE.finditer(modified_content):
+                pass
+            if last_import:
+                last_import_pos = last_import.end()
+                modified_content = modified_content[:last_import_pos] + b'\n' + import_statement + modified_content[last_import_pos:]
             else:
                 # No imports found, add at the beginning after any module docstring
-                docstring_match = re.match(r'(^""".*?"""\s*\n)', modified_content, re.DOTALL)
+                docstring_match = _MODULE_DOCSTRING.match(modified_content)
                 if docstring_match:
                     end_pos = docstring_match.end()
-                    modified_content = modified_content[:end_pos] + '\n' + import_statement + '\n' + modified_content[end_pos:]
+                    modified_content = modified_content[:end_pos] + b'\n' + import_statement + b'\n' + modified_content[end_pos:]
                 else:
                     # No docstring, add at the beginning
-                    modified_content = import_statement + '\n' + modified_content
+                    modified_content = import_statement + b'\n' + modified_content
 
     return modified_content
 
@@ -129,108 +133,54 @@ def replace_timestamp_patterns(content):
     Replace timestamp patterns with standardized UTC timestamp utilities.
 
     Args:
-        content: File content to process
+        content: Raw file content to process
 
     Returns:
-        Tuple[str, int]: Modified content and count of patterns replaced
+        Tuple[bytes, int]: Modified content and count of patterns replaced
     """
-    original_content = content
     patterns_replaced = 0
 
-    # Replace patterns for direct datetime.now() usage
-    new_content, replaced = re.subn(
-        DATETIME_NOW,
-        'get_utc_timestamp()',
-        content
-    )
-    patterns_replaced += replaced
-    content = new_content
-
-    # Replace datetime.utcnow() patterns
-    new_content, replaced = re.subn(
-        DATETIME_UTC_NOW,
-        'get_utc_timestamp()',
-        content
-    )
-    patterns_replaced += replaced
-    content = new_content
-
-    # Replace datetime.now().strftime() patterns
-    new_content, replaced = re.subn(
-        DATETIME_NOW_WITH_STRFTIME,
-        lambda m: handle_strftime_replacement(m.group(1)),
-        content
-    )
-    patterns_replaced += replaced
-    content = new_content
-
-    # Replace timestamp variable assignments
-    new_content, replaced = re.subn(
-        TIMESTAMP_VARIABLE_ASSIGN,
-        r'\1 = get_utc_timestamp()',
-        content
-    )
-    patterns_replaced += replaced
-    content = new_content
-
-    # Replace "if timestamp is None" patterns
-    new_content, replaced = re.subn(
-        IF_TIMESTAMP_NONE,
-        'if timestamp is None: timestamp = get_utc_timestamp()',
-        content
-    )
-    patterns_replaced += replaced
-    content = new_content
-
-    # Replace timestamp argument default patterns
-    new_content, replaced = re.subn(
-        TIMESTAMP_ARG_DEFAULT,
-        r'\1get_utc_timestamp()',
-        content
-    )
-    patterns_replaced += replaced
-    content = new_content
-
-    # Replace class init timestamp assignment
-    new_content, replaced = re.subn(
-        CLASS_INIT_TIMESTAMP,
-        r'\1get_utc_timestamp()',
-        content
-    )
-    patterns_replaced += replaced
-    content = new_content
-
-    # Replace timestamp assignments in dictionaries
-    new_content, replaced = re.subn(
-        TIMESTAMP_ASSIGNMENT,
-        r'\1get_utc_timestamp()',
-        content
-    )
-    patterns_replaced += replaced
-    content = new_content
-
-    # Original patterns from current implementation
-    new_content, replaced = re.subn(DATETIME_NOW_ISOFORMAT, 'format_timestamp()', content)
-    patterns_replaced += replaced
-    content = new_content
+    for pattern, replacement in _REPLACEMENTS:
+        content, replaced = pattern.subn(replacement, content)
+        patterns_replaced += replaced
 
-    new_content, replaced = re.subn(NAIVE_TIMESTAMP_ASSIGNMENT, r'\1format_timestamp()', content)
-    patterns_replaced += replaced
-    content = new_content
-
-    new_content, replaced = re.subn(LLM_TIMESTAMP_ASSIGNMENT, r'\1format_timestamp()', content)
-    patterns_replaced += replaced
-    content = new_content
+    return content, patterns_replaced
 
-    new_content, replaced = re.subn(TOOL_TIMESTAMP_ASSIGNMENT, r'\1format_timestamp()', content)
-    patterns_replaced += replaced
-    content = new_content
 
-    new_content, replaced = re.subn(SYSTEM_TIMESTAMP_ASSIGNMENT, r'\1format_timestamp()', content)
-    patterns_replaced += replaced
-    content = new_content
+# Substitutions applied by replace_timestamp_patterns, in order. The
+# "timestamp"/llm/tool/*_time assignment patterns are not listed: the bare
+# DATETIME_NOW_ISOFORMAT pass already rewrites every call they would match.
+# Files are processed as raw bytes, so patterns and replacements are encoded.
+_REPLACEMENTS = tuple(
+    (re.compile(pattern.encode()), replacement if callable(replacement) else replacement.encode())
+    for pattern, replacement in (
+        # Direct datetime.now() usage
+        (DATETIME_NOW, 'get_utc_timestamp()'),
+        # datetime.utcnow()
+        (DATETIME_UTC_NOW, 'get_utc_timestamp()'),
+        # datetime.now().strftime()
+        (DATETIME_NOW_WITH_STRFTIME,
+         lambda m: handle_strftime_replacement(m.group(1).decode('utf-8')).encode('utf-8')),
+        # Timestamp variable assignments
+        (TIMESTAMP_VARIABLE_ASSIGN, r'\1 = get_utc_timestamp()'),
+        # "if timestamp is None" patterns
+        (IF_TIMESTAMP_NONE, 'if timestamp is None: timestamp = get_utc_timestamp()'),
+        # Timestamp argument defaults
+        (TIMESTAMP_ARG_DEFAULT, r'\1get_utc_timestamp()'),
+        # Class init timestamp assignment
+        (CLASS_INIT_TIMESTAMP, r'\1get_utc_timestamp()'),
+        # Timestamp assignments in dictionaries
+        (TIMESTAMP_ASSIGNMENT, r'\1get_utc_timestamp()'),
+        # datetime.now().isoformat()
+        (DATETIME_NOW_ISOFORMAT, 'format_timestamp()'),
+    )
+)
 
-    return content, patterns_replaced
+# Patterns that decide which imports a file needs
+_NEEDS_FORMAT_TIMESTAMP = re.compile(f'{DATETIME_NOW_ISOFORMAT}|{NAIVE_TIMESTAMP_ASSIGNMENT}'.encode())
+_NEEDS_UTC_TIMESTAMP = re.compile(
+    f'{DATETIME_NOW}|{DATETIME_NOW_WITH_STRFTIME}|{TIMESTAMP_VARIABLE_ASSIGN}|{DATETIME_UTC_NOW}'.encode()
+)
 
 
 def process_file(file_path, dry_run=False):
@@ -252,8 +202,8 @@ def process_file(file_path, dry_run=False):
     logger.info(f"Processing {file_path}...")
 
     try:
-        # Read file content
-        with open(file_path, 'r', encoding='utf-8') as f:
+        # Read raw file content; the patterns are ASCII, so no decoding is needed
+        with open(file_path, 'rb') as f:
             content = f.read()
 
         # Make a copy of original content
@@ -262,11 +212,10 @@ def process_file(file_path, dry_run=False):
         # Determine which imports are needed based on patterns in the file
         imports_needed = []
 
-        if re.search(DATETIME_NOW_ISOFORMAT, content) or re.search(NAIVE_TIMESTAMP_ASSIGNMENT, content):
+        if _NEEDS_FORMAT_TIMESTAMP.search(content):
             imports_needed.append(FORMAT_TIMESTAMP_IMPORT)
 
-        if (re.search(DATETIME_NOW, content) or re.search(DATETIME_NOW_WITH_STRFTIME, content) or
-            re.search(TIMESTAMP_VARIABLE_ASSIGN, content) or re.search(DATETIME_UTC_NOW, content)):
+        if _NEEDS_UTC_TIMESTAMP.search(content):
             imports_needed.append(GET_UTC_TIMESTAMP_IMPORT)
 
         # If both imports are needed, use the combined import instead
@@ -286,7 +235,7 @@ def process_file(file_path, dry_run=False):
         if content != original_content:
             file_stats['updated'] = True
             if not dry_run:
-                with open(file_path, 'w', encoding='utf-8') as f:
+                with open(file_path, 'wb') as f:
                     f.write(content)
                 logger.info(f"Updated {file_path} - Replaced {patterns_replaced} patterns")
             else:
@@ -351,11 +300,13 @@ def main():
         'errors': 0
     }
 
-    # Process each file
-    for file_path in python_files:
-        # Process the file and collect statistics
-        file_stats = process_file(file_path, dry_run=args.dry_run)
+    # Files are independent, so process them in parallel across cores
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(
+            partial(process_file, dry_run=args.dry_run), python_files, chunksize=8
+        )
 
+    for file_stats in results:
         # Update overall statistics
         stats['files_processed'] += 1
         stats['files_updated'] += 1 if file_stats['updated'] else 0
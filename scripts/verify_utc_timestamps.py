@@ -8,17 +8,45 @@ all timestamps follow the UTC format with "Z" suffix.
 
 import argparse
 import json
+import mmap
 import re
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Regex pattern for valid ISO 8601 UTC timestamp with Z suffix
 VALID_TIMESTAMP_PATTERN = r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z'
+_match_valid_timestamp = re.compile(VALID_TIMESTAMP_PATTERN).match
 
 
 def is_valid_timestamp(timestamp):
     """Check if a timestamp follows the UTC format with Z suffix."""
-    return bool(re.match(VALID_TIMESTAMP_PATTERN, timestamp))
+    return _match_valid_timestamp(timestamp) is not None
+
+
+def _parse_event(line):
+    """Parse one JSON line, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # Fall back for input only the json module accepts, such as NaN
+            pass
+    return json.loads(line)
+
+
+def _iter_lines(file_path):
+    """Yield the raw lines of a file through a read-only memory map."""
+    with open(file_path, 'rb') as f:
+        # Empty files cannot be memory-mapped
+        if f.seek(0, 2) == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b"")
 
 
 def validate_event_file(file_path):
@@ -27,33 +55,34 @@ def validate_event_file(file_path):
     valid_count = 0
     invalid_count = 0
     invalid_lines = []
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            try:
-                # Parse JSON event
-                event = json.loads(line.strip())
-
-                # Check primary timestamp
-                if "timestamp" in event:
-                    timestamp = event["timestamp"]
-                    if not is_valid_timestamp(timestamp):
-                        invalid_lines.append((line_num, "timestamp", timestamp))
-                        invalid_count += 1
-                    else:
-                        valid_count += 1
-
-                # Check nested timestamps in attributes
-                if "attributes" in event and isinstance(event["attributes"], dict):
-                    for key, value in event["attributes"].items():
-                        if "timestamp" in key.lower() and isinstance(value, str):
-                            if not is_valid_timestamp(value):
-                                invalid_lines.append((line_num, key, value))
-                                invalid_count += 1
-                            else:
-                                valid_count += 1
-            except json.JSONDecodeError:
-                print(f"Warning: Line {line_num} is not valid JSON")
+    # Bind the matcher locally; it runs once per timestamp in the file
+    match_timestamp = _match_valid_timestamp
+
+    for line_num, line in enumerate(_iter_lines(file_path), 1):
+        try:
+            # Parse JSON event straight from the raw bytes
+            event = _parse_event(line.strip())
+
+            # Check primary timestamp
+            if "timestamp" in event:
+                timestamp = event["timestamp"]
+                if match_timestamp(timestamp) is None:
+                    invalid_lines.append((line_num, "timestamp", timestamp))
+                    invalid_count += 1
+                else:
+                    valid_count += 1
+
+            # Check nested timestamps in attributes
+            if "attributes" in event and isinstance(event["attributes"], dict):
+                for key, value in event["attributes"].items():
+                    if "timestamp" in key.lower() and isinstance(value, str):
+                        if match_timestamp(value) is None:
+                            invalid_lines.append((line_num, key, value))
+                            invalid_count += 1
+                        else:
+                            valid_count += 1
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            print(f"Warning: Line {line_num} is not valid JSON")
 
     # Print results
     print(f"Found {valid_count} valid timestamps and {invalid_count} invalid timestamps")
@@ -25,6 +25,8 @@ stop_monitoring()
 ```
 """
 
+import importlib
+
 # Apply compatibility patches to handle version differences safely
 # This must be done first, before any instrumentation patching
 try:
@@ -40,21 +42,11 @@ except Exception as e:
 # This prevents errors when patching tools with annotated types
 
 from cylestio_monitor.monitor import (start_monitoring, stop_monitoring)
-# Apply patchers automatically on import
-# This ensures all supported frameworks are automatically patched
-from cylestio_monitor.patchers import (patch_anthropic_module,
-                                       patch_decorated_tools, patch_langchain,
-                                       patch_langgraph, patch_mcp,
-                                       patch_openai_module,
-                                       patch_tool_decorator)
 from cylestio_monitor.utils.event_logging import log_error, log_event
 from cylestio_monitor.utils.instrumentation import (Span, instrument_function,
                                                     instrument_method)
 from cylestio_monitor.utils.trace_context import TraceContext
 
-# Import the API client module to make it available
-from . import api_client
-
 __version__ = "0.1.12"
 
 __all__ = [
@@ -69,44 +61,28 @@ __all__ = [
     "api_client",
 ]
 
-# Patching is now done in start_monitoring() to ensure trace context is initialized first
-# These auto-patching blocks are disabled to prevent early patching before trace context is set
-'''
-# Try to apply all patchers automatically
-# These will only apply if the related libraries are imported
-try:
-    patch_anthropic_module()
-except Exception:
-    pass
-
-try:
-    patch_openai_module()
-except Exception:
-    pass
-
-try:
-    patch_langchain()
-except Exception:
-    pass
-
-try:
-    patch_langgraph()
-except Exception:
-    pass
-
-try:
-    patch_mcp()
-except Exception:
-    pass
-
-# Apply the tool patchers
-try:
-    patch_tool_decorator()
-except Exception:
-    pass
-
-try:
-    patch_decorated_tools()
-except Exception:
-    pass
-'''
+# Patch functions stay importable from the package root, but are loaded from
+# cylestio_monitor.patchers only when first accessed
+_PATCHER_FUNCTIONS = frozenset(
+    {
+        "patch_anthropic_module",
+        "patch_decorated_tools",
+        "patch_langchain",
+        "patch_langgraph",
+        "patch_mcp",
+        "patch_openai_module",
+        "patch_tool_decorator",
+    }
+)
+
+
+def __getattr__(name):
+    """Resolve patch functions and the API client module lazily (PEP 562)."""
+    if name in _PATCHER_FUNCTIONS:
+        from cylestio_monitor import patchers
+
+        return getattr(patchers, name)
+    if name == "api_client":
+        # Importing the submodule also binds it as a package attribute
+        return importlib.import_module("cylestio_monitor.api_client")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,15 +6,18 @@ It supports both synchronous and asynchronous sending of data.
 
 import json
 import logging
+import re
 import threading
 import time
-import urllib.request
 import urllib.parse
 from datetime import datetime
+from functools import lru_cache
 from queue import Empty, Queue
 from typing import Any, Dict, List, Optional, Tuple
 import os
 
+import requests
+
 from cylestio_monitor.api_authentication import DescopeAuthenticator
 from cylestio_monitor.config import ConfigManager
 from cylestio_monitor.utils.serialization import safe_event_serialize
@@ -29,6 +32,31 @@ _event_queue: Queue = Queue()
 _sender_thread: Optional[threading.Thread] = None
 _thread_stop_event = threading.Event()
 
+# Clients used by the background sender, keyed by (endpoint, http_method)
+_sender_clients: Dict[Tuple[str, str], "ApiClient"] = {}
+
+# Client used by send_event_to_api(), created on first use and rebuilt when
+# the settings it was created from change
+_default_client: Optional["ApiClient"] = None
+_default_client_settings: Optional[Tuple[Any, ...]] = None
+_default_client_lock = threading.Lock()
+
+# Shape of timestamps produced by format_timestamp(), e.g. 2023-09-15T14:30:45.123456Z
+_FORMATTED_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z\Z")
+
+
+@lru_cache(maxsize=256)
+def _endpoint_scheme(endpoint: str) -> str:
+    """Return the URL scheme of an endpoint, parsed once per endpoint.
+
+    Args:
+        endpoint: The API endpoint
+
+    Returns:
+        str: The endpoint's URL scheme
+    """
+    return urllib.parse.urlparse(endpoint).scheme
+
 
 class ApiClient:
     """Client for sending telemetry data to the Cylestio API."""
@@ -87,6 +115,12 @@ class ApiClient:
         # Initialize Descope authenticator for JWT token generation
         self._authenticator = DescopeAuthenticator.get_instance(access_key=access_key)
 
+        # Pooled HTTP session so consecutive events reuse the same connection
+        self._session = requests.Session()
+        self._session.headers.update(
+            {"Content-Type": "application/json", "User-Agent": "Cylestio-Monitor/1.0"}
+        )
+
     def send_event(self, event: Dict[str, Any]) -> bool:
         """Send an event to the API.
 
@@ -103,7 +137,11 @@ class ApiClient:
         event_copy = event.copy()
         if 'timestamp' not in event_copy:
             event_copy['timestamp'] = format_timestamp()
-        elif isinstance(event_copy['timestamp'], (str, datetime)):
+        elif isinstance(event_copy['timestamp'], datetime) or (
+            isinstance(event_copy['timestamp'], str)
+            and not _FORMATTED_TIMESTAMP_RE.match(event_copy['timestamp'])
+        ):
+            # Timestamps produced by format_timestamp() are passed through as-is
             event_copy['timestamp'] = format_timestamp(event_copy['timestamp'])
 
         # Check if we should send in background
@@ -118,6 +156,10 @@ class ApiClient:
                 self.endpoint, self.http_method, self.timeout, event_copy
             )
 
+    def close(self) -> None:
+        """Close the pooled HTTP session and its connections."""
+        self._session.close()
+
     def _ensure_serializable(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """Ensure the event is JSON serializable.
 
@@ -152,52 +194,64 @@ class ApiClient:
         """
         try:
             # Validate URL scheme to prevent file:// vulnerabilities
-            parsed_url = urllib.parse.urlparse(endpoint)
-            if parsed_url.scheme not in ["http", "https"]:
-                logger.error(f"Invalid URL scheme: {parsed_url.scheme}. Only http and https schemes are allowed.")
+            scheme = _endpoint_scheme(endpoint)
+            if scheme not in ("http", "https"):
+                logger.error(f"Invalid URL scheme: {scheme}. Only http and https schemes are allowed.")
                 return False
 
             # Convert event to JSON
             event_json = json.dumps(event)
             event_bytes = event_json.encode("utf-8")
 
-            # Create request
-            req = urllib.request.Request(
-                url=endpoint, data=event_bytes, method=http_method
-            )
-
-            # Add headers
-            req.add_header("Content-Type", "application/json")
-            req.add_header("User-Agent", "Cylestio-Monitor/1.0")
-            
             # Add authorization header if access key is configured
+            headers = {}
             if self.access_key:
                 jwt_token = self._authenticator.get_jwt_token()
                 if jwt_token:
-                    req.add_header("Authorization", f"Bearer {jwt_token}")
+                    headers["Authorization"] = f"Bearer {jwt_token}"
                 else:
                     logger.error("Failed to get JWT token")
                     return False
 
-            # Send request
-            with urllib.request.urlopen(req, timeout=timeout) as response:  # nosec B310 - URL is validated above
-                status = response.status
-
-                if status < 200 or status >= 300:
-                    # Invalidate token on authentication errors
-                    if status == 401 or status == 403:
-                        self._authenticator.invalidate_token()
-                        logger.warning("Authentication error occurred, invalidating JWT token to refresh next time")
-                    
-                    logger.warning(f"API request failed with status {status}")
-                    return False
+            # Send request over the pooled session
+            response = self._session.request(
+                http_method, endpoint, data=event_bytes, headers=headers, timeout=timeout
+            )
+            status = response.status_code
 
-                return True
+            if status < 200 or status >= 300:
+                # Invalidate token on authentication errors
+                if status == 401 or status == 403:
+                    self._authenticator.invalidate_token()
+                    logger.warning("Authentication error occurred, invalidating JWT token to refresh next time")
+
+                logger.warning(f"API request failed with status {status}")
+                return False
+
+            return True
 
         except Exception as e:
             logger.error(f"Unexpected error sending event to API: {e}")
             return False
 
+
+def _get_sender_client(endpoint: str, http_method: str) -> ApiClient:
+    """Get a reusable client for sending queued events.
+
+    Args:
+        endpoint: The API endpoint
+        http_method: The HTTP method
+
+    Returns:
+        ApiClient: The client for this endpoint and method
+    """
+    key = (endpoint, http_method)
+    client = _sender_clients.get(key)
+    if client is None:
+        client = _sender_clients[key] = ApiClient(endpoint, http_method)
+    return client
+
+
 def _background_sender_thread():
     """Background thread for sending events to the API."""
     logger.debug("Starting background sender thread")
@@ -211,13 +265,16 @@ def _background_sender_thread():
     try:
         while not _thread_stop_event.is_set():
             try:
-                # Get the next event from the queue with a timeout
+                # Wait for the next event, then take whatever else is already
+                # queued without blocking, up to a full batch
                 try:
-                    event_data = _event_queue.get(timeout=1.0)
-                    batch.append(event_data)
+                    batch.append(_event_queue.get(timeout=1.0))
                     _event_queue.task_done()
+                    while len(batch) < batch_size:
+                        batch.append(_event_queue.get_nowait())
+                        _event_queue.task_done()
                 except Empty:
-                    # No new events
+                    # No more events for now
                     pass
 
                 # Check if we should send the batch
@@ -226,8 +283,8 @@ def _background_sender_thread():
                     # Process the batch
                     for endpoint, http_method, timeout, event in batch:
                         try:
-                            # Get an API client and send directly
-                            client = ApiClient(endpoint, http_method)
+                            # Reuse the API client for this endpoint and send directly
+                            client = _get_sender_client(endpoint, http_method)
                             client._send_event_direct(
                                 endpoint, http_method, timeout, event
                             )
@@ -250,7 +307,7 @@ def _background_sender_thread():
         # Attempt to send any remaining events
         for endpoint, http_method, timeout, event in batch:
             try:
-                client = ApiClient(endpoint, http_method)
+                client = _get_sender_client(endpoint, http_method)
                 client._send_event_direct(endpoint, http_method, timeout, event)
             except Exception as send_exception:
                 # Log detailed error
@@ -269,7 +326,7 @@ def _ensure_background_thread_running():
 
 def stop_background_thread():
     """Stop the background sender thread."""
-    global _sender_thread
+    global _sender_thread, _default_client, _default_client_settings
 
     if _sender_thread and _sender_thread.is_alive():
         logger.debug("Stopping background sender thread")
@@ -281,12 +338,23 @@ def stop_background_thread():
         while not _event_queue.empty():
             try:
                 endpoint, http_method, timeout, event = _event_queue.get(block=False)
-                client = ApiClient(endpoint, http_method)
+                client = _get_sender_client(endpoint, http_method)
                 client._send_event_direct(endpoint, http_method, timeout, event)
                 _event_queue.task_done()
             except:
                 break
 
+    # Close and drop cached clients so a restarted monitor picks up new
+    # configuration without leaking pooled connections
+    for client in _sender_clients.values():
+        client.close()
+    _sender_clients.clear()
+    with _default_client_lock:
+        if _default_client is not None:
+            _default_client.close()
+        _default_client = None
+        _default_client_settings = None
+
 
 def get_api_client() -> ApiClient:
     """Get an API client with the default configuration.
@@ -314,11 +382,52 @@ def send_event_to_api(event: Dict[str, Any]) -> bool:
     if masked_event is None:
         masked_event = event
 
-    # Create client
-    client = ApiClient()
+    return send_masked_event_to_api(masked_event)
+
+
+def send_masked_event_to_api(event: Dict[str, Any]) -> bool:
+    """Send an event that has already been masked to the API.
+
+    Used by log_event, which masks each event once before both writing it
+    to the log file and sending it here.
+
+    Args:
+        event: The masked event to send
+
+    Returns:
+        bool: True if event was sent successfully
+    """
+    # Reuse the default client so its HTTP session stays open between events
+    global _default_client, _default_client_settings
+    settings = _default_client_settings_snapshot()
+    client = _default_client
+    if client is None or settings != _default_client_settings:
+        with _default_client_lock:
+            if _default_client is None or settings != _default_client_settings:
+                stale_client = _default_client
+                _default_client = ApiClient()
+                _default_client_settings = settings
+                if stale_client is not None:
+                    stale_client.close()
+            client = _default_client
 
     # Send event
-    return client.send_event(masked_event)
+    return client.send_event(event)
+
+
+def _default_client_settings_snapshot() -> Tuple[Any, ...]:
+    """Get the settings a default ApiClient is built from.
+
+    Returns:
+        Tuple: Endpoint, access key and HTTP method settings
+    """
+    config = ConfigManager()
+    return (
+        os.environ.get("CYLESTIO_TELEMETRY_ENDPOINT"),
+        config.get("api.endpoint"),
+        config.get("api.access_key"),
+        config.get("api.http_method"),
+    )
 
 
 def send_event_to_api_legacy(
@@ -4,8 +4,9 @@ import importlib.resources
 import logging
 import os
 import shutil
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import platformdirs
 import yaml
@@ -13,6 +14,12 @@ import yaml
 logger = logging.getLogger("CylestioMonitor")
 
 
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted configuration key once per distinct key."""
+    return tuple(key.split("."))
+
+
 class ConfigManager:
     """
     Manages the configuration for Cylestio Monitor.
@@ -104,10 +111,9 @@ class ConfigManager:
         Returns:
             The configuration value, or the default if not found
         """
-        keys = key.split(".")
         value = self._config
 
-        for k in keys:
+        for k in _split_key(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
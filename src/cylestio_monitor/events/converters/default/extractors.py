@@ -6,6 +6,19 @@ This module provides functions for extracting specific data from events during c
 
 from typing import Any, Dict
 
+# Performance keys mapped to their output names; token metrics use OTel
+# semantic conventions
+_PERFORMANCE_KEYS = {
+    "processing_time": "processing_time",
+    "latency": "latency",
+    "tokens": "tokens",
+    "input_tokens": "llm.usage.prompt_tokens",
+    "output_tokens": "llm.usage.completion_tokens",
+    "total_tokens": "llm.usage.total_tokens",
+}
+
+_USAGE_TOKEN_KEYS = frozenset(("prompt_tokens", "completion_tokens", "total_tokens"))
+
 
 def extract_security_info(
     event: Dict[str, Any], data: Dict[str, Any]
@@ -50,30 +63,14 @@ def extract_performance_metrics(
     performance = {}
 
     # Extract common performance metrics
-    perf_keys = [
-        "processing_time",
-        "latency",
-        "tokens",
-        "input_tokens",
-        "output_tokens",
-        "total_tokens",
-    ]
-    for key in perf_keys:
+    for key, name in _PERFORMANCE_KEYS.items():
         if key in data:
-            # Use OTel semantic conventions for token metrics
-            if key == "input_tokens":
-                performance["llm.usage.prompt_tokens"] = data[key]
-            elif key == "output_tokens":
-                performance["llm.usage.completion_tokens"] = data[key]
-            elif key == "total_tokens":
-                performance["llm.usage.total_tokens"] = data[key]
-            else:
-                performance[key] = data[key]
+            performance[name] = data[key]
 
     # Extract nested token usage
     if "usage" in data and isinstance(data["usage"], dict):
         for key, value in data["usage"].items():
-            if key in ["prompt_tokens", "completion_tokens", "total_tokens"]:
+            if key in _USAGE_TOKEN_KEYS:
                 performance[f"llm.usage.{key}"] = value
 
     return performance
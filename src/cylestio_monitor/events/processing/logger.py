@@ -60,6 +60,10 @@ EVENT_NAME_MAPPING = {
     "mcp_response": "mcp.response",
 }
 
+# Name suffixes of events that finish a span and of events that start one
+_FINISH_EVENT_SUFFIXES = (".response", ".end", ".result")
+_START_EVENT_SUFFIXES = (".request", ".start", ".execution")
+
 
 def _get_event_id(event_name: str, data: Dict[str, Any]) -> str:
     """Generate a unique identifier for events to track duplicates.
@@ -217,18 +221,10 @@ def log_event(
 
         # For sequential events from the same agent (like LLM_call_start → LLM_call_finish),
         # create child spans to maintain relationship
-        if (
-            otel_name.endswith(".response")
-            or otel_name.endswith(".end")
-            or otel_name.endswith(".result")
-        ):
+        if otel_name.endswith(_FINISH_EVENT_SUFFIXES):
             # This is a finish event, so we keep the same span ID
             pass
-        elif (
-            otel_name.endswith(".request")
-            or otel_name.endswith(".start")
-            or otel_name.endswith(".execution")
-        ):
+        elif otel_name.endswith(_START_EVENT_SUFFIXES):
             # For start events, we create a child span for subsequent events
             trace_id, span_id, parent_span_id = create_child_span(agent_id)
 
@@ -14,6 +14,50 @@ from cylestio_monitor.config import ConfigManager
 # Get configuration manager instance
 config_manager = ConfigManager()
 
+# Keys that might contain sensitive information
+_SENSITIVE_KEYS = [
+    "api_key",
+    "key",
+    "secret",
+    "password",
+    "auth_token",
+    "authorization",
+    "access_token",
+    "refresh_token",
+]
+
+# Keys that should not be masked despite containing sensitive key substrings
+_EXCLUDE_KEYS = frozenset(
+    {
+        "input_tokens",
+        "output_tokens",
+        "total_tokens",  # LLM token usage metrics
+        "prompt_tokens",
+        "completion_tokens",  # OpenAI token metrics
+        "cache_creation_input_tokens",
+        "cache_read_input_tokens",  # Anthropic cache metrics
+    }
+)
+
+# Regular expressions for common API key and token formats, compiled once
+# at import time since they are applied to every string value in an event
+_API_KEY_PATTERNS = [
+    re.compile(r"sk-[a-zA-Z0-9]{20,}"),  # OpenAI API key format
+    re.compile(r"Bearer\s+[a-zA-Z0-9\._\-]+"),  # Bearer token format
+    re.compile(r"eyJ[a-zA-Z0-9\._\-]{10,}"),  # JWT token format
+]
+
+# String fields that hold message content directly
+_DIRECT_CONTENT_FIELDS = ("content", "message", "text", "prompt", "response", "value")
+
+
+def _mask_match(match: "re.Match[str]") -> str:
+    """Mask a matched credential, keeping its first and last 4 characters."""
+    secret = match.group(0)
+    if len(secret) > 8:
+        return secret[:4] + "*" * (len(secret) - 8) + secret[-4:]
+    return "********"
+
 
 def normalize_text(text: str) -> str:
     """
@@ -60,6 +104,27 @@ def contains_dangerous(text: str) -> bool:
     return any(keyword in normalized for keyword in dangerous_keywords)
 
 
+def _classify_text(text: str) -> str:
+    """
+    Classify text as dangerous, suspicious or neither in a single pass.
+
+    Normalizes the text once and checks dangerous keywords before
+    suspicious ones, stopping at the first match.
+
+    Args:
+        text: The text to check
+
+    Returns:
+        str: "dangerous", "suspicious", or "none"
+    """
+    normalized = normalize_text(text)
+    if any(keyword in normalized for keyword in config_manager.get_dangerous_keywords()):
+        return "dangerous"
+    if any(keyword in normalized for keyword in config_manager.get_suspicious_keywords()):
+        return "suspicious"
+    return "none"
+
+
 def mask_sensitive_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Masks sensitive data like API keys and tokens.
@@ -73,36 +138,6 @@ def mask_sensitive_data(data: Dict[str, Any]) -> Dict[str, Any]:
     # Create a deep copy to avoid modifying the original
     masked_data = copy.deepcopy(data)
 
-    # Keys that might contain sensitive information
-    sensitive_keys = [
-        "api_key",
-        "key",
-        "secret",
-        "password",
-        "auth_token",
-        "authorization",
-        "access_token",
-        "refresh_token",
-    ]
-
-    # Keys that should not be masked despite containing sensitive key substrings
-    exclude_keys = [
-        "input_tokens",
-        "output_tokens",
-        "total_tokens",  # LLM token usage metrics
-        "prompt_tokens",
-        "completion_tokens",  # OpenAI token metrics
-        "cache_creation_input_tokens",
-        "cache_read_input_tokens",  # Anthropic cache metrics
-    ]
-
-    # Regular expressions for common API key and token formats
-    api_key_patterns = [
-        r"sk-[a-zA-Z0-9]{20,}",  # OpenAI API key format
-        r"Bearer\s+[a-zA-Z0-9\._\-]+",  # Bearer token format
-        r"eyJ[a-zA-Z0-9\._\-]{10,}",  # JWT token format
-    ]
-
     def _mask_value(value, key_name=""):
         """Recursively mask sensitive values."""
         if isinstance(value, dict):
@@ -111,9 +146,10 @@ def mask_sensitive_data(data: Dict[str, Any]) -> Dict[str, Any]:
             return [_mask_value(item) for item in value]
         elif isinstance(value, str):
             # Check if this is a sensitive key, but exclude specific metrics keys
-            if any(
-                sensitive_key in key_name.lower() for sensitive_key in sensitive_keys
-            ) and not any(key_name == exclude_key for exclude_key in exclude_keys):
+            key_lower = key_name.lower()
+            if key_name not in _EXCLUDE_KEYS and any(
+                sensitive_key in key_lower for sensitive_key in _SENSITIVE_KEYS
+            ):
                 if len(value) > 8:
                     return value[:4] + "*" * (len(value) - 8) + value[-4:]
                 else:
@@ -121,16 +157,8 @@ def mask_sensitive_data(data: Dict[str, Any]) -> Dict[str, Any]:
 
             # Check for sensitive patterns in the string regardless of key name
             masked = value
-            for pattern in api_key_patterns:
-                masked = re.sub(
-                    pattern,
-                    lambda m: (
-                        m.group(0)[:4] + "*" * (len(m.group(0)) - 8) + m.group(0)[-4:]
-                        if len(m.group(0)) > 8
-                        else "********"
-                    ),
-                    masked,
-                )
+            for pattern in _API_KEY_PATTERNS:
+                masked = pattern.sub(_mask_match, masked)
             return masked
         return value
 
@@ -152,7 +180,7 @@ def check_security_concerns(data: Dict[str, Any]) -> str:
     content_values = []
 
     # Check for direct string fields first
-    for field in ["content", "message", "text", "prompt", "response", "value"]:
+    for field in _DIRECT_CONTENT_FIELDS:
         if field in data and isinstance(data[field], str):
             content_values.append(data[field])
 
@@ -179,17 +207,16 @@ def check_security_concerns(data: Dict[str, Any]) -> str:
 
     # Check all extracted content values for dangerous or suspicious words
     for content in content_values:
-        if contains_dangerous(content):
-            return "dangerous"
-        elif contains_suspicious(content):
-            return "suspicious"
+        alert = _classify_text(content)
+        if alert != "none":
+            return alert
 
     # Check data values for suspicious or dangerous content
     for key, value in data.items():
-        if isinstance(value, str):
-            if contains_dangerous(value):
-                return "dangerous"
-            elif contains_suspicious(value):
-                return "suspicious"
+        # Direct content fields were already checked above
+        if isinstance(value, str) and key not in _DIRECT_CONTENT_FIELDS:
+            alert = _classify_text(value)
+            if alert != "none":
+                return alert
 
     return "none"
@@ -9,10 +9,9 @@ import os
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from .api_client import get_api_client
 from .config import ConfigManager
 from .patchers.mcp_patcher import patch_mcp, unpatch_mcp
-from .utils.event_logging import log_event
+from .utils.event_logging import close_log_file, log_event
 from .utils.trace_context import TraceContext
 
 # Configure root logger
@@ -22,6 +21,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Name prefixes of the SDK's own loggers
+_SDK_LOGGER_PREFIXES = ("cylestio_", "CylestioMonitor")
+
 
 def start_monitoring(
     agent_id: str,
@@ -106,7 +108,7 @@ def start_monitoring(
     # Get all other SDK loggers and configure them too
     sdk_loggers = [
         logging.getLogger(name) for name in logging.root.manager.loggerDict
-        if name.startswith("cylestio_") or name.startswith("CylestioMonitor")
+        if name.startswith(_SDK_LOGGER_PREFIXES)
     ]
 
     # Process events output file path if provided
@@ -444,6 +446,9 @@ def stop_monitoring() -> None:
     except Exception as e:
         logger.warning(f"Error stopping background API thread: {e}")
 
+    # Close the events output file
+    close_log_file()
+
     # Reset the trace context
     TraceContext.reset()
 
@@ -464,7 +469,7 @@ def stop_monitoring() -> None:
     # Clean up all other SDK loggers
     sdk_loggers = [
         logging.getLogger(name) for name in logging.root.manager.loggerDict
-        if name.startswith("cylestio_") or name.startswith("CylestioMonitor")
+        if name.startswith(_SDK_LOGGER_PREFIXES)
     ]
 
     for sdk_logger in sdk_loggers:
@@ -3,41 +3,47 @@
 This module contains patchers for various frameworks and libraries.
 """
 
+import importlib
 import logging
 
-from .anthropic import (AnthropicPatcher, patch_anthropic_module,
-                        unpatch_anthropic_module)
 # Expose patcher classes
 from .base import BasePatcher
-from .decorated_tools_patcher import (DecoratedToolsPatcher,
-                                      patch_decorated_tools,
-                                      unpatch_decorated_tools)
-from .langchain_callbacks import (ToolMonitorCallbackHandler,
-                                  get_callback_handler)
-from .langchain_patcher import (LangChainPatcher, patch_langchain,
-                                unpatch_langchain)
-# Expose the patching functions for all supported frameworks
-from .mcp_patcher import MCPPatcher, patch_mcp, unpatch_mcp
-from .openai_patcher import (OpenAIPatcher, patch_openai_module,
-                             unpatch_openai_module)
-from .tool_decorator_patcher import (ToolDecoratorPatcher,
-                                     patch_tool_decorator,
-                                     unpatch_tool_decorator)
 
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
-# Try to import LangGraph patcher if available
-try:
-    from . import langgraph_patcher
-    from .langgraph_patcher import (LangGraphPatcher, patch_langgraph,
-                                    unpatch_langgraph)
+# Patchers are imported on first access (PEP 562) so that loading the package
+# doesn't import every supported framework up front
+_LAZY_ATTRIBUTES = {
+    "AnthropicPatcher": ".anthropic",
+    "patch_anthropic_module": ".anthropic",
+    "unpatch_anthropic_module": ".anthropic",
+    "DecoratedToolsPatcher": ".decorated_tools_patcher",
+    "patch_decorated_tools": ".decorated_tools_patcher",
+    "unpatch_decorated_tools": ".decorated_tools_patcher",
+    "ToolMonitorCallbackHandler": ".langchain_callbacks",
+    "get_callback_handler": ".langchain_callbacks",
+    "LangChainPatcher": ".langchain_patcher",
+    "patch_langchain": ".langchain_patcher",
+    "unpatch_langchain": ".langchain_patcher",
+    "LangGraphPatcher": ".langgraph_patcher",
+    "patch_langgraph": ".langgraph_patcher",
+    "unpatch_langgraph": ".langgraph_patcher",
+    "MCPPatcher": ".mcp_patcher",
+    "patch_mcp": ".mcp_patcher",
+    "unpatch_mcp": ".mcp_patcher",
+    "OpenAIPatcher": ".openai_patcher",
+    "patch_openai_module": ".openai_patcher",
+    "unpatch_openai_module": ".openai_patcher",
+    "ToolDecoratorPatcher": ".tool_decorator_patcher",
+    "patch_tool_decorator": ".tool_decorator_patcher",
+    "unpatch_tool_decorator": ".tool_decorator_patcher",
+}
 
-    logger.debug("LangGraph patcher imported successfully")
-except ImportError:
-    logger.debug("LangGraph not available, skipping patcher import")
 
-    # Define empty functions to avoid errors if called
+def _langgraph_fallbacks():
+    """Build no-op stand-ins used when the LangGraph patcher can't be imported."""
+
     def patch_langgraph():
         logger.warning("LangGraph is not available, patch_langgraph has no effect")
 
@@ -52,6 +58,36 @@ except ImportError:
         def unpatch(self):
             logger.warning("LangGraph is not available, unpatch method has no effect")
 
+    return {
+        "patch_langgraph": patch_langgraph,
+        "unpatch_langgraph": unpatch_langgraph,
+        "LangGraphPatcher": LangGraphPatcher,
+    }
+
+
+def __getattr__(name):
+    """Import a patcher attribute on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ImportError:
+        if module_name != ".langgraph_patcher":
+            raise
+        logger.debug("LangGraph not available, skipping patcher import")
+        globals().update(_langgraph_fallbacks())
+        return globals()[name]
+
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 # Define what's available via imports
 __all__ = [
@@ -6,6 +6,7 @@ import json
 import logging
 import time
 import traceback
+import weakref
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -22,8 +23,10 @@ from ..utils.event_utils import format_timestamp
 from ..utils.trace_context import TraceContext
 from .base import BasePatcher
 
-# Track patched clients to prevent duplicate patching
-_patched_clients = set()
+# Track patched clients to prevent duplicate patching. Clients are held
+# weakly, so entries go away with the client and a recycled id() can never
+# make a new client look already patched
+_patched_clients = weakref.WeakSet()
 _is_module_patched = False
 
 # Store original methods for restoration
@@ -55,8 +58,7 @@ class AnthropicPatcher(BasePatcher):
             return
 
         # Check if this client is already patched
-        client_id = id(self.client)
-        if client_id in _patched_clients:
+        if self.client in _patched_clients:
             self.logger.warning("Anthropic client already patched, skipping")
             return
 
@@ -155,7 +157,7 @@ class AnthropicPatcher(BasePatcher):
                         self._log_security_event(security_info, request_data)
 
                     # Log the request with debug mode info if enabled
-                    if self.debug_mode:
+                    if self.debug_mode and self.logger.isEnabledFor(logging.DEBUG):
                         self.logger.debug(
                             f"Request data: {json.dumps(request_data)[:500]}..."
                         )
@@ -250,7 +252,7 @@ class AnthropicPatcher(BasePatcher):
                                 )
 
                         # Debug logging
-                        if self.debug_mode:
+                        if self.debug_mode and self.logger.isEnabledFor(logging.DEBUG):
                             self.logger.debug(
                                 f"Response data: {json.dumps(safe_content)[:500]}..."
                             )
@@ -345,7 +347,7 @@ class AnthropicPatcher(BasePatcher):
 
             # Mark as patched
             self.is_patched = True
-            _patched_clients.add(client_id)
+            _patched_clients.add(self.client)
             self.logger.info("Successfully patched Anthropic client")
         else:
             self.logger.warning(
@@ -707,9 +709,7 @@ class AnthropicPatcher(BasePatcher):
         self.original_funcs = {}
 
         # Remove from patched clients
-        client_id = id(self.client)
-        if client_id in _patched_clients:
-            _patched_clients.remove(client_id)
+        _patched_clients.discard(self.client)
 
         self.is_patched = False
         self.logger.info("Successfully unpatched Anthropic client")
@@ -5,6 +5,7 @@ import json
 import logging
 import time
 import traceback
+import weakref
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -25,8 +26,10 @@ from .base import BasePatcher
 # Import security scanner
 from ..security_detection import SecurityScanner
 
-# Track patched clients to prevent duplicate patching
-_patched_clients = set()
+# Track patched clients to prevent duplicate patching. Clients are held
+# weakly, so entries go away with the client and a recycled id() can never
+# make a new client look already patched
+_patched_clients = weakref.WeakSet()
 _is_module_patched = False
 
 # Store original methods for restoration
@@ -65,8 +68,7 @@ class OpenAIPatcher(BasePatcher):
             return
 
         # Check if this client is already patched
-        client_id = id(self.client)
-        if client_id in _patched_clients:
+        if self.client in _patched_clients:
             self.logger.warning("OpenAI client already patched, skipping")
             return
 
@@ -159,7 +161,7 @@ class OpenAIPatcher(BasePatcher):
                         self._log_security_event(security_info, request_data)
 
                     # Log the request with debug mode info if enabled
-                    if self.debug_mode:
+                    if self.debug_mode and self.logger.isEnabledFor(logging.DEBUG):
                         self.logger.debug(
                             f"Request data: {json.dumps(request_data)[:500]}..."
                         )
@@ -388,7 +390,7 @@ class OpenAIPatcher(BasePatcher):
                         self._log_security_event(security_info, request_data)
 
                     # Log the request with debug mode info if enabled
-                    if self.debug_mode:
+                    if self.debug_mode and self.logger.isEnabledFor(logging.DEBUG):
                         self.logger.debug(f"Request data: {json.dumps(request_data)[:500]}...")
 
                     # Log the request event
@@ -616,7 +618,7 @@ class OpenAIPatcher(BasePatcher):
                         self._log_security_event(security_info, request_data)
 
                     # Log the request with debug mode info if enabled
-                    if self.debug_mode:
+                    if self.debug_mode and self.logger.isEnabledFor(logging.DEBUG):
                         self.logger.debug(
                             f"Request data: {json.dumps(request_data)[:500]}..."
                         )
@@ -849,7 +851,7 @@ class OpenAIPatcher(BasePatcher):
                         self._log_security_event(security_info, request_data)
 
                     # Log the request with debug mode info if enabled
-                    if self.debug_mode:
+                    if self.debug_mode and self.logger.isEnabledFor(logging.DEBUG):
                         self.logger.debug(
                             f"Request data: {json.dumps(request_data)[:500]}..."
                         )
@@ -996,7 +998,7 @@ class OpenAIPatcher(BasePatcher):
             self.client.completions.acreate = wrapped_async_completion_create
 
         # Mark client as patched
-        _patched_clients.add(client_id)
+        _patched_clients.add(self.client)
         self.is_patched = True
         self.logger.debug("Successfully patched OpenAI client")
 
@@ -1431,9 +1433,7 @@ class OpenAIPatcher(BasePatcher):
             self.client.completions.create = self.original_funcs["completions.create"]
 
         # Remove from patched clients set
-        client_id = id(self.client)
-        if client_id in _patched_clients:
-            _patched_clients.remove(client_id)
+        _patched_clients.discard(self.client)
 
         self.is_patched = False
         self.logger.info("OpenAI client successfully unpatched")
@@ -14,6 +14,12 @@ from cylestio_monitor.config import ConfigManager
 
 logger = logging.getLogger("CylestioMonitor.Security")
 
+# Backreferences depend on group numbering and break when patterns are combined
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+# Everything except digits, stripped from card and phone numbers before masking
+_NON_DIGITS = re.compile(r"[^0-9]")
+
 
 class PatternRegistry:
     """Thread-safe registry of compiled regex patterns for security scanning."""
@@ -27,15 +33,29 @@ class PatternRegistry:
     # Compiled patterns - immutable after initialization
     _patterns: Dict[str, Dict[str, Any]] = {}
 
+    # Union of all patterns, used to skip texts that match none of them
+    _prefilter: Optional[Pattern] = None
+    _prefilter_source: Optional[Dict[str, Dict[str, Any]]] = None
+    _prefilter_size = 0
+
     # Flags for initialization state
     _is_initialized = False
 
     def __new__(cls, config_manager=None):
         """Create or return the singleton instance with thread safety."""
+        # Once published the instance never changes, so callers on the hot
+        # path read it without taking the lock
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
         with cls._init_lock:
             if cls._instance is None:
-                cls._instance = super(PatternRegistry, cls).__new__(cls)
-                cls._instance._initialize(config_manager)
+                instance = super(PatternRegistry, cls).__new__(cls)
+                instance._initialize(config_manager)
+                # Publish only after initialization so unlocked readers
+                # never see a partially initialized instance
+                cls._instance = instance
             return cls._instance
 
     def _initialize(self, config_manager=None):
@@ -127,8 +147,33 @@ class PatternRegistry:
                 # Log error but continue with other patterns
                 logger.error(f"Error compiling pattern {name}: {e}")
 
+        self._build_prefilter()
+
         logger.info(f"Loaded {len(self._patterns)} patterns")
 
+    def _build_prefilter(self):
+        """Compile the union of all patterns into a single prefilter regex.
+
+        One search with the union tells whether any pattern can match, so
+        texts without sensitive data are rejected in a single pass instead
+        of one pass per pattern. Patterns with backreferences cannot be
+        combined safely, so no prefilter is used when any are present.
+        """
+        self._prefilter = None
+        self._prefilter_source = self._patterns
+        self._prefilter_size = len(self._patterns)
+
+        regexes = [info["pattern"].pattern for info in self._patterns.values()]
+        if not regexes or any(_BACKREFERENCE.search(regex) for regex in regexes):
+            return
+
+        try:
+            self._prefilter = re.compile(
+                "|".join(f"(?:{regex})" for regex in regexes), re.IGNORECASE
+            )
+        except re.error as e:
+            logger.debug(f"Could not build pattern prefilter: {e}")
+
     def _get_default_patterns(self) -> Dict[str, Dict[str, str]]:
         """Return default patterns if none are configured.
 
@@ -209,7 +254,7 @@ class PatternRegistry:
 
         elif mask_method == "credit_card":
             # Credit card - keep first 4 digits, mask the rest
-            digits_only = re.sub(r'[^0-9]', '', value)
+            digits_only = _NON_DIGITS.sub('', value)
             if len(digits_only) >= 12:  # Only mask if it looks like a credit card
                 return digits_only[:4] + '-****-****-' + digits_only[-4:]
             else:
@@ -234,7 +279,7 @@ class PatternRegistry:
 
         elif mask_method == "phone":
             # Phone - only show last 4 digits
-            digits = re.sub(r'[^0-9]', '', value)
+            digits = _NON_DIGITS.sub('', value)
             if len(digits) >= 10:
                 return "***-***-" + digits[-4:]
             else:
@@ -269,6 +314,17 @@ class PatternRegistry:
         if not text:
             return results
 
+        # Reject texts that match no pattern with a single union search, as
+        # long as the prefilter was built for the current pattern set
+        prefilter = self._prefilter
+        if (
+            prefilter is not None
+            and self._prefilter_source is self._patterns
+            and self._prefilter_size == len(self._patterns)
+            and prefilter.search(text) is None
+        ):
+            return results
+
         # Scan with all patterns
         for name, pattern_info in self._patterns.items():
             compiled_pattern = pattern_info["pattern"]
@@ -339,8 +395,24 @@ class PatternRegistry:
         if not matches:
             return text
 
-        # Sort matches by position in reverse order to avoid offset issues
-        # when replacing substrings
+        # Matches that don't overlap are stitched together from slices of the
+        # original text, without copying it into a list of characters
+        matches.sort(key=lambda x: x["position"])
+        pieces = []
+        last_end = 0
+        for match in matches:
+            start = match["position"]
+            if start < last_end:
+                break
+            pieces.append(text[last_end:start])
+            pieces.append(match["masked_value"])
+            last_end = start + len(match["matched_value"])
+        else:
+            pieces.append(text[last_end:])
+            return ''.join(pieces)
+
+        # Overlapping matches: sort by position in reverse order to avoid
+        # offset issues when replacing substrings
         matches.sort(key=lambda x: x["position"], reverse=True)
 
         # Create a mutable version of the text
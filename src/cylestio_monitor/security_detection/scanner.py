@@ -9,6 +9,7 @@ consistent access to security keywords from a central source.
 import logging
 import re
 import threading
+from functools import lru_cache
 from typing import Any, Dict, List, Set, Optional, Tuple
 
 from cylestio_monitor.config import ConfigManager
@@ -16,6 +17,73 @@ from cylestio_monitor.security_detection.patterns import PatternRegistry
 
 logger = logging.getLogger("CylestioMonitor.Security")
 
+# SQL and system commands that are always detected, regardless of config
+_SQL_COMMANDS = frozenset({"drop", "delete", "truncate", "alter", "create", "insert",
+                           "update", "select", "exec", "shutdown", "format", "eval"})
+
+# Commands that are common English words and need a usage-context check
+_AMBIGUOUS_COMMANDS = frozenset({"drop", "format", "eval", "delete", "exec", "shutdown"})
+
+# Context terms used to disambiguate the commands above
+_STORAGE_TERMS = frozenset({"hard", "drive", "disk", "partition", "memory", "usb", "flash", "sd card"})
+_TEXT_TERMS = frozenset({"text", "document", "properly", "paragraph", "string"})
+_CODE_TERMS = frozenset({"code", "script", "javascript", "function"})
+_DROP_FALSE_POSITIVES = frozenset({"dropdown", "drop-down", "droplet", "dropping"})
+
+# Categories in priority order (dangerous_commands takes precedence over others)
+_CATEGORY_PRIORITY = ("dangerous_commands", "prompt_manipulation", "sensitive_data")
+
+# Alert level for each severity; anything not listed is "suspicious"
+_ALERT_LEVELS = {"low": "suspicious", "medium": "suspicious", "high": "dangerous"}
+
+
+@lru_cache(maxsize=1024)
+def _word_pattern(keyword: str) -> "re.Pattern":
+    """Compile (once per keyword) a pattern matching keyword at word boundaries."""
+    return re.compile(r'\b' + re.escape(keyword) + r'\b')
+
+
+def _compile_keyword_gate(keywords: Set[str]) -> Optional["re.Pattern"]:
+    """Compile one pattern that matches if any keyword would match.
+
+    Mirrors _word_boundary_match: multi-word keywords match as plain
+    substrings, single words only at word boundaries.
+
+    Args:
+        keywords: Keywords to combine
+
+    Returns:
+        Compiled union pattern, or None if there are no keywords
+    """
+    alternatives = [
+        re.escape(keyword) if " " in keyword else r'\b' + re.escape(keyword) + r'\b'
+        for keyword in sorted(keywords)
+        if keyword
+    ]
+    if not alternatives:
+        return None
+    return re.compile("|".join(alternatives))
+
+
+# Constant fields of the result returned when there is nothing to scan;
+# "keywords" is added per call so callers always get their own list
+_EMPTY_SCAN_RESULT = {"alert_level": "none", "category": None, "severity": None, "description": None}
+
+
+def _join_message_contents(messages: List[Any]) -> Optional[str]:
+    """Join the content of message dicts into one text for scanning.
+
+    Args:
+        messages: Messages to read
+
+    Returns:
+        Space-separated contents, or None if no message has content
+    """
+    contents = [str(msg["content"]) for msg in messages if isinstance(msg, dict) and "content" in msg]
+    if not contents:
+        return None
+    return " ".join(contents).strip()
+
 
 class SecurityScanner:
     """Thread-safe security scanner for all event types."""
@@ -34,6 +102,9 @@ class SecurityScanner:
     # Category configuration - immutable after initialization
     _categories: Dict[str, Dict[str, Any]] = {}
 
+    # Union of the sensitive data keywords, paired with the keyword set it was built from
+    _sensitive_data_gate: Tuple[Optional[Set[str]], Optional["re.Pattern"]] = (None, None)
+
     # Pattern registry for regex pattern matching
     _pattern_registry: Optional[PatternRegistry] = None
 
@@ -42,10 +113,19 @@ class SecurityScanner:
 
     def __new__(cls, config_manager=None):
         """Create or return the singleton instance with thread safety."""
+        # Once published the instance never changes, so callers on the hot
+        # path read it without taking the lock
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
         with cls._init_lock:
             if cls._instance is None:
-                cls._instance = super(SecurityScanner, cls).__new__(cls)
-                cls._instance._initialize(config_manager)
+                instance = super(SecurityScanner, cls).__new__(cls)
+                instance._initialize(config_manager)
+                # Publish only after initialization so unlocked readers
+                # never see a partially initialized instance
+                cls._instance = instance
             return cls._instance
 
     def _initialize(self, config_manager=None):
@@ -94,12 +174,8 @@ class SecurityScanner:
                     elif category == "dangerous_commands":
                         # Store dangerous commands preserving original case and adding lowercase versions
                         self._dangerous_commands_keywords = set()
-                        # Add all SQL and database commands that should be detected without case sensitivity
-                        sql_commands = ["drop", "delete", "truncate", "alter", "create", "insert",
-                                      "update", "select", "exec", "shutdown", "format", "eval"]
-
                         # Make sure all basic SQL commands are included even if not in config
-                        for cmd in sql_commands:
+                        for cmd in _SQL_COMMANDS:
                             self._dangerous_commands_keywords.add(cmd)
                             self._dangerous_commands_keywords.add(cmd.upper())
 
@@ -153,12 +229,8 @@ class SecurityScanner:
 
         # Store dangerous commands preserving original case and adding lowercase versions
         self._dangerous_commands_keywords = set()
-        # Add all SQL and database commands that should be detected without case sensitivity
-        sql_commands = ["drop", "delete", "truncate", "alter", "create", "insert",
-                      "update", "select", "exec", "shutdown", "format", "eval"]
-
         # Make sure all basic SQL commands are included even if not in config
-        for cmd in sql_commands:
+        for cmd in _SQL_COMMANDS:
             self._dangerous_commands_keywords.add(cmd)
             self._dangerous_commands_keywords.add(cmd.upper())
 
@@ -232,7 +304,7 @@ class SecurityScanner:
         """
         # Skip if None
         if event is None:
-            return {"alert_level": "none", "category": None, "severity": None, "description": None, "keywords": []}
+            return {**_EMPTY_SCAN_RESULT, "keywords": []}
 
         # Extract text based on event type
         text = self._extract_text_from_event(event)
@@ -285,12 +357,9 @@ class SecurityScanner:
 
                     # Handle messages array in node result (common LangGraph pattern)
                     if "messages" in node_result and isinstance(node_result["messages"], list):
-                        extracted_text = ""
-                        for msg in node_result["messages"]:
-                            if isinstance(msg, dict) and "content" in msg:
-                                extracted_text += str(msg["content"]) + " "
-                        if extracted_text:
-                            return extracted_text.strip()
+                        extracted_text = _join_message_contents(node_result["messages"])
+                        if extracted_text is not None:
+                            return extracted_text
 
                     # If node result contains content directly
                     if "content" in node_result:
@@ -305,12 +374,9 @@ class SecurityScanner:
 
                     # Handle messages array in node state
                     if "messages" in node_state and isinstance(node_state["messages"], list):
-                        extracted_text = ""
-                        for msg in node_state["messages"]:
-                            if isinstance(msg, dict) and "content" in msg:
-                                extracted_text += str(msg["content"]) + " "
-                        if extracted_text:
-                            return extracted_text.strip()
+                        extracted_text = _join_message_contents(node_state["messages"])
+                        if extracted_text is not None:
+                            return extracted_text
 
                         # If node state contains content directly
                         if "content" in node_state:
@@ -325,12 +391,9 @@ class SecurityScanner:
 
                     # Handle messages array in state
                     if "messages" in state and isinstance(state["messages"], list):
-                        extracted_text = ""
-                        for msg in state["messages"]:
-                            if isinstance(msg, dict) and "content" in msg:
-                                extracted_text += str(msg["content"]) + " "
-                        if extracted_text:
-                            return extracted_text.strip()
+                        extracted_text = _join_message_contents(state["messages"])
+                        if extracted_text is not None:
+                            return extracted_text
 
                         # If state contains content directly
                         if "content" in state:
@@ -344,11 +407,9 @@ class SecurityScanner:
                     content = attributes["llm.response.content"]
                     # Handle array of content blocks
                     if isinstance(content, list):
-                        extracted_text = ""
-                        for item in content:
-                            if isinstance(item, dict) and "text" in item:
-                                extracted_text += item["text"] + " "
-                        return extracted_text.strip()
+                        return " ".join(
+                            item["text"] for item in content if isinstance(item, dict) and "text" in item
+                        ).strip()
                     return str(content)
                 # Input content
                 elif "llm.request.data" in attributes and isinstance(attributes["llm.request.data"], dict):
@@ -374,7 +435,7 @@ class SecurityScanner:
         """
         # Skip if None or empty
         if not text:
-            return {"alert_level": "none", "category": None, "severity": None, "description": None, "keywords": []}
+            return {**_EMPTY_SCAN_RESULT, "keywords": []}
 
         # Original text for exact case matching
         original = text
@@ -389,13 +450,19 @@ class SecurityScanner:
             "sensitive_data": []
         }
 
-        # Check ALL dangerous commands and collect matches
+        # Check ALL dangerous commands and collect matches. Every match needs
+        # the lowercased keyword somewhere in the lowercased text, so a plain
+        # substring test rules most keywords out before the slower checks
         for keyword in self._dangerous_commands_keywords:
+            if keyword.lower() not in normalized:
+                continue
             if self._simple_text_match(keyword, original) or self._simple_text_match(keyword, normalized):
                 matches["dangerous_commands"].append(keyword)
 
         # Check ALL prompt manipulation keywords and collect matches
         for keyword in self._prompt_manipulation_keywords:
+            if keyword.lower() not in normalized:
+                continue
             # For multi-word prompt manipulation phrases, use simple contains on either original or lowercase
             if " " in keyword:
                 if keyword in original or (keyword.lower() in normalized and keyword.lower() == keyword):
@@ -407,10 +474,12 @@ class SecurityScanner:
             elif self._word_boundary_match(keyword, normalized):
                 matches["prompt_manipulation"].append(keyword)
 
-        # Check ALL sensitive data keywords and collect matches
-        for keyword in self._sensitive_data_keywords:
-            if self._word_boundary_match(keyword, normalized):
-                matches["sensitive_data"].append(keyword)
+        # Check ALL sensitive data keywords and collect matches, skipping the
+        # per-keyword checks when a single pass over the text finds none
+        if self._sensitive_data_keywords_present(normalized):
+            for keyword in self._sensitive_data_keywords:
+                if self._word_boundary_match(keyword, normalized):
+                    matches["sensitive_data"].append(keyword)
 
         # Check patterns with pattern registry
         pattern_matches = []
@@ -457,6 +526,23 @@ class SecurityScanner:
 
         return result
 
+    def _sensitive_data_keywords_present(self, normalized: str) -> bool:
+        """Check whether any sensitive data keyword occurs in the text.
+
+        Args:
+            normalized: Lowercased text to search
+
+        Returns:
+            True if at least one keyword matches
+        """
+        keywords = self._sensitive_data_keywords
+        source, gate = self._sensitive_data_gate
+        # Rebuild the union whenever the keyword set has been replaced
+        if source is not keywords:
+            gate = _compile_keyword_gate(keywords)
+            self._sensitive_data_gate = (keywords, gate)
+        return gate is not None and gate.search(normalized) is not None
+
     def _determine_category_and_severity(self, matches: Dict[str, List[str]], pattern_matches: List[Dict[str, Any]] = None) -> Tuple[Optional[str], Optional[str], str, Optional[str], List[str]]:
         """Determine the most severe category and appropriate severity based on matches.
 
@@ -488,11 +574,8 @@ class SecurityScanner:
                     if pattern_severity == "high":
                         break
 
-        # Priority order of categories (dangerous_commands takes precedence over others)
-        priority_order = ["dangerous_commands", "prompt_manipulation", "sensitive_data"]
-
         # Find the highest priority category that has matches
-        for category in priority_order:
+        for category in _CATEGORY_PRIORITY:
             if matches[category] and category in self._categories:
                 # Get category config
                 category_config = self._categories[category]
@@ -508,11 +591,7 @@ class SecurityScanner:
                 description = category_config.get("description", f"{category} detection")
 
                 # Map severity to alert level
-                alert_level = {
-                    "low": "suspicious",
-                    "medium": "suspicious",
-                    "high": "dangerous"
-                }.get(severity, "suspicious")
+                alert_level = _ALERT_LEVELS.get(severity, "suspicious")
 
                 # If we have a high severity pattern match, use it for dangerous commands and sensitive_data
                 if highest_pattern_severity == "high" and (category == "sensitive_data" or not matches["dangerous_commands"]):
@@ -522,9 +601,7 @@ class SecurityScanner:
 
         # If we get here and have a pattern match, use it
         if highest_pattern_severity:
-            alert_level = "suspicious"
-            if highest_pattern_severity == "high":
-                alert_level = "dangerous"
+            alert_level = _ALERT_LEVELS.get(highest_pattern_severity, "suspicious")
             return highest_pattern_category, highest_pattern_severity, alert_level, highest_pattern_description, matches.get(highest_pattern_category, [])
 
         # Fallback if we have matches but no category in priority order matched
@@ -539,9 +616,7 @@ class SecurityScanner:
 
                 severity = category_config.get("severity", "medium")
                 description = category_config.get("description", f"{category} detection")
-                alert_level = "suspicious"
-                if severity == "high":
-                    alert_level = "dangerous"
+                alert_level = _ALERT_LEVELS.get(severity, "suspicious")
                 return category, severity, alert_level, description, keywords
 
         # Ultimate fallback (should never happen)
@@ -566,60 +641,38 @@ class SecurityScanner:
             return keyword in text
 
         # For single words that are SQL commands, use word boundary matching to avoid false positives
-        # List of SQL commands and dangerous commands that need context-aware matching
-        sql_commands = {"drop", "delete", "truncate", "alter", "create", "insert",
-                      "update", "select", "exec", "shutdown", "format", "eval"}
-
-        if keyword.lower() in sql_commands:
+        keyword_lower = keyword.lower()
+        if keyword_lower in _SQL_COMMANDS:
             # If it's an exact match (the whole text is just the command), it's a match
-            if text.strip().lower() == keyword.lower():
+            if text.strip().lower() == keyword_lower:
                 return True
 
             # Check for word boundaries
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if not re.search(pattern, text):
+            if not _word_pattern(keyword).search(text):
                 return False
 
             # For potentially ambiguous keywords, we need to check for usage context
-            if keyword.lower() in {"drop", "format", "eval", "delete", "exec", "shutdown"}:
+            if keyword_lower in _AMBIGUOUS_COMMANDS:
                 # First check if it's used in a technical/programming context
                 text_lower = text.lower()
 
                 # For "format", only match if it's about formatting storage, not text/documents
-                if keyword.lower() == "format":
-                    # Check for "format" + storage-related terms
-                    storage_terms = {"hard", "drive", "disk", "partition", "memory", "usb", "flash", "sd card"}
-
-                    has_storage_context = any(term in text_lower for term in storage_terms)
-                    has_text_context = any(term in text_lower for term in
-                                           {"text", "document", "properly", "paragraph", "string"})
-
+                if keyword_lower == "format":
                     # Only match if clear storage context, but not text context
-                    if not has_storage_context and has_text_context:
+                    if (not any(term in text_lower for term in _STORAGE_TERMS)
+                            and any(term in text_lower for term in _TEXT_TERMS)):
                         return False
 
                 # For "eval", only match if it's about code evaluation
-                if keyword.lower() == "eval":
-                    # Only match if seems to be about code evaluation
-                    if "evaluate" in text_lower and not any(term in text_lower for term in
-                                                         {"code", "script", "javascript", "function"}):
+                elif keyword_lower == "eval":
+                    if "evaluate" in text_lower and not any(term in text_lower for term in _CODE_TERMS):
                         return False
 
-                # For "drop", look for database context
-                if keyword.lower() == "drop":
-                    # Common false positives for "drop"
-                    false_positive_terms = {"dropdown", "drop-down", "droplet", "dropping"}
-
-                    # Check false positives first
-                    for term in false_positive_terms:
-                        if term in text_lower:
-                            return False
-
-                    # No need to check for database context - that's handled by word boundary check
-
-            # If uppercase, it's likely a SQL statement
-            if keyword.isupper():
-                return True
+                # For "drop", reject common false positives; database context is
+                # already handled by the word boundary check
+                elif keyword_lower == "drop":
+                    if any(term in text_lower for term in _DROP_FALSE_POSITIVES):
+                        return False
 
             # Default to matching SQL commands if they pass word boundary check
             return True
@@ -646,8 +699,7 @@ class SecurityScanner:
             return keyword in text
 
         # For single words, check word boundaries
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        return bool(re.search(pattern, text))
+        return _word_pattern(keyword).search(text) is not None
 
     @staticmethod
     def get_instance(config_manager=None) -> "SecurityScanner":
@@ -692,6 +744,22 @@ class SecurityScanner:
         # Create a shallow copy of the event and update with masked text
         return self._update_event_with_masked_text(event, masked_text)
 
+    def _mask_message_contents(self, messages: List[Any]) -> None:
+        """Mask the content of each message dict that contains sensitive data.
+
+        Each message is scanned once; messages without sensitive data are
+        left untouched.
+
+        Args:
+            messages: Messages to update in place
+        """
+        for msg in messages:
+            if isinstance(msg, dict) and "content" in msg:
+                original_content = str(msg["content"])
+                masked_content = self._pattern_registry.mask_text_in_place(original_content)
+                if masked_content != original_content:
+                    msg["content"] = masked_content
+
     def _update_event_with_masked_text(self, event: Any, masked_text: str) -> Any:
         """Update event with masked text in the appropriate field.
 
@@ -740,21 +808,7 @@ class SecurityScanner:
 
                     # Handle messages array in node result
                     if "messages" in node_result and isinstance(node_result["messages"], list):
-                        # We need to scan each message individually and only mask those with sensitive data
-                        for i, msg in enumerate(node_result["messages"]):
-                            if isinstance(msg, dict) and "content" in msg:
-                                # Extract the original content
-                                original_content = str(msg["content"])
-
-                                # Check if this specific message contains sensitive data
-                                # by scanning it with the pattern registry
-                                matches = self._pattern_registry.scan_text(original_content)
-
-                                # Only mask if sensitive data was found in this message
-                                if matches:
-                                    # Mask just this message's content
-                                    msg_masked_text = self._pattern_registry.mask_text_in_place(original_content)
-                                    node_result["messages"][i]["content"] = msg_masked_text
+                        self._mask_message_contents(node_result["messages"])
 
                     # If content field exists directly in node result
                     elif "content" in node_result:
@@ -766,21 +820,7 @@ class SecurityScanner:
 
                     # Handle messages array in node state
                     if "messages" in node_state and isinstance(node_state["messages"], list):
-                        # We need to scan each message individually and only mask those with sensitive data
-                        for i, msg in enumerate(node_state["messages"]):
-                            if isinstance(msg, dict) and "content" in msg:
-                                # Extract the original content
-                                original_content = str(msg["content"])
-
-                                # Check if this specific message contains sensitive data
-                                # by scanning it with the pattern registry
-                                matches = self._pattern_registry.scan_text(original_content)
-
-                                # Only mask if sensitive data was found in this message
-                                if matches:
-                                    # Mask just this message's content
-                                    msg_masked_text = self._pattern_registry.mask_text_in_place(original_content)
-                                    node_state["messages"][i]["content"] = msg_masked_text
+                        self._mask_message_contents(node_state["messages"])
 
                     # If content field exists directly in node state
                     elif "content" in node_state:
@@ -792,21 +832,7 @@ class SecurityScanner:
 
                     # Handle messages array in state
                     if "messages" in state and isinstance(state["messages"], list):
-                        # We need to scan each message individually and only mask those with sensitive data
-                        for i, msg in enumerate(state["messages"]):
-                            if isinstance(msg, dict) and "content" in msg:
-                                # Extract the original content
-                                original_content = str(msg["content"])
-
-                                # Check if this specific message contains sensitive data
-                                # by scanning it with the pattern registry
-                                matches = self._pattern_registry.scan_text(original_content)
-
-                                # Only mask if sensitive data was found in this message
-                                if matches:
-                                    # Mask just this message's content
-                                    msg_masked_text = self._pattern_registry.mask_text_in_place(original_content)
-                                    state["messages"][i]["content"] = msg_masked_text
+                        self._mask_message_contents(state["messages"])
 
                     # If content field exists directly in state
                     elif "content" in state:
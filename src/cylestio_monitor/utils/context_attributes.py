@@ -8,24 +8,30 @@ about the runtime environment to telemetry events.
 import os
 import platform
 import sys
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version
 from typing import Dict, List, Optional
 
 
-def get_environment_context() -> Dict[str, str]:
-    """Get information about the runtime environment.
-
-    Returns:
-        Dict[str, str]: Dictionary containing environment context information
-    """
-    context = {
+@lru_cache(maxsize=1)
+def _static_environment_context() -> Dict[str, str]:
+    """Collect the environment context once; none of it changes at runtime."""
+    return {
         "os.type": platform.system(),
         "os.version": platform.version(),
         "python.version": sys.version.split()[0],
         "machine.type": platform.machine(),
     }
 
-    return context
+
+def get_environment_context() -> Dict[str, str]:
+    """Get information about the runtime environment.
+
+    Returns:
+        Dict[str, str]: Dictionary containing environment context information
+    """
+    # Return a copy so callers can't modify the cached values
+    return dict(_static_environment_context())
 
 
 def get_library_versions(libraries: Optional[List[str]] = None) -> Dict[str, str]:
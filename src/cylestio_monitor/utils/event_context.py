@@ -34,6 +34,17 @@ _global_context: Dict[str, Any] = {
 _default_session_id = str(uuid.uuid4())
 
 
+def _refresh_process_id() -> None:
+    """Update the cached process ID in a forked child."""
+    _global_context["process.id"] = os.getpid()
+
+
+# The process ID is read once above; refresh it in forked children so their
+# events aren't attributed to the parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_process_id)
+
+
 def initialize_context() -> None:
     """Initialize the thread-local context with default values."""
     if not hasattr(_thread_local, "context"):
@@ -5,9 +5,12 @@ This module provides an improved logging mechanism for the enhanced JSON structu
 adhering to OpenTelemetry conventions for telemetry data.
 """
 
+import atexit
 import json
 import logging
+import threading
 from datetime import datetime
+from queue import Empty, SimpleQueue
 from typing import Any, Dict, Optional
 
 from cylestio_monitor.config import ConfigManager
@@ -26,6 +29,19 @@ from cylestio_monitor.security_detection import SecurityScanner
 # Configure logger
 logger = logging.getLogger("CylestioMonitor")
 
+# Events file kept open between writes, reopened when the configured path changes
+_events_file_handle = None
+_events_file_path: Optional[str] = None
+_events_file_lock = threading.Lock()
+
+# Serialized events waiting to be written by the background writer thread.
+# The queue also carries flush markers (threading.Event) and a None item
+# that stops the writer.
+_events_write_queue: SimpleQueue = SimpleQueue()
+_events_writer_thread: Optional[threading.Thread] = None
+_events_writer_lock = threading.Lock()  # Guards starting and stopping the writer
+_MAX_WRITE_BATCH = 256  # Max events combined into a single write
+
 
 def log_event(
     name: str,
@@ -179,6 +195,10 @@ def log_event(
 def _write_to_log_file(event: Dict[str, Any]) -> None:
     """Write event to log file.
 
+    The event is serialized here and handed to a background thread, which
+    appends queued events to the file in batches. Writes are asynchronous:
+    call ``flush_log_file()`` before reading the file back.
+
     Args:
         event: The event to write
     """
@@ -191,29 +211,175 @@ def _write_to_log_file(event: Dict[str, Any]) -> None:
     if events_file:
         try:
             logger.debug(f"Writing event to file: {events_file}")
-            logger.debug(f"Event data: {json.dumps(event)[:200]}...")
+            line = json.dumps(event)
+            logger.debug(f"Event data: {line[:200]}...")
 
-            with open(events_file, "a") as f:
-                f.write(json.dumps(event) + "\n")
-
-            logger.debug("Successfully wrote event to file")
+            _events_write_queue.put((events_file, line + "\n"))
+            _ensure_writer_thread_running()
         except Exception as e:
             logger.error(f"Failed to write to event file: {e}")
     else:
         logger.debug("No events output file configured, skipping file logging")
 
 
+def _events_writer() -> None:
+    """Background thread that writes queued events to the events file.
+
+    Each wake-up drains up to ``_MAX_WRITE_BATCH`` queued events and writes
+    consecutive events for the same file with a single call, then flushes so
+    the events are visible to readers straight away. Flush markers queued
+    with the events are set once everything queued before them is written.
+    A ``None`` item stops the thread.
+    """
+    stopping = False
+    while not stopping:
+        item = _events_write_queue.get()
+        batch = []
+        flushed = []
+        while True:
+            if item is None:
+                stopping = True
+                break
+            if isinstance(item, threading.Event):
+                flushed.append(item)
+            else:
+                batch.append(item)
+                if len(batch) >= _MAX_WRITE_BATCH:
+                    break
+            try:
+                item = _events_write_queue.get_nowait()
+            except Empty:
+                break
+
+        if batch:
+            _write_batch(batch)
+        for marker in flushed:
+            marker.set()
+
+
+def _write_batch(batch) -> None:
+    """Append a batch of ``(events_file, line)`` items to their files.
+
+    Args:
+        batch: Serialized events in the order they were logged
+    """
+    with _events_file_lock:
+        start = 0
+        while start < len(batch):
+            events_file = batch[start][0]
+            end = start + 1
+            while end < len(batch) and batch[end][0] == events_file:
+                end += 1
+            try:
+                handle = _get_events_file_handle(events_file)
+                handle.write("".join(line for _, line in batch[start:end]))
+                handle.flush()
+                logger.debug(f"Wrote {end - start} events to file: {events_file}")
+            except Exception as e:
+                logger.error(f"Failed to write to event file: {e}")
+            start = end
+
+
+def _ensure_writer_thread_running() -> None:
+    """Ensure the background events writer thread is running."""
+    global _events_writer_thread
+
+    if _events_writer_thread is None or not _events_writer_thread.is_alive():
+        with _events_writer_lock:
+            if _events_writer_thread is None or not _events_writer_thread.is_alive():
+                _events_writer_thread = threading.Thread(
+                    target=_events_writer, name="cylestio-events-writer", daemon=True
+                )
+                _events_writer_thread.start()
+
+
+def flush_log_file(timeout: Optional[float] = 5.0) -> bool:
+    """Wait until every event logged so far has been written to the file.
+
+    Args:
+        timeout: Maximum number of seconds to wait, or None to wait forever
+
+    Returns:
+        bool: True if the queued events were written before the timeout
+    """
+    writer = _events_writer_thread
+    if writer is None or not writer.is_alive():
+        return True
+
+    marker = threading.Event()
+    _events_write_queue.put(marker)
+    return marker.wait(timeout)
+
+
+def _get_events_file_handle(events_file: str):
+    """Get the open handle for the events file, opening it if needed.
+
+    Callers must hold ``_events_file_lock``.
+
+    Args:
+        events_file: Path of the events output file
+
+    Returns:
+        The file object to append events to
+    """
+    global _events_file_handle, _events_file_path
+
+    if _events_file_handle is None or _events_file_path != events_file:
+        _close_events_file_handle()
+        _events_file_handle = open(events_file, "a")
+        _events_file_path = events_file
+    return _events_file_handle
+
+
+def _close_events_file_handle() -> None:
+    """Close the current events file handle. Callers must hold the lock."""
+    global _events_file_handle, _events_file_path
+
+    if _events_file_handle is not None:
+        try:
+            _events_file_handle.close()
+        except Exception as e:
+            logger.debug(f"Error closing event file: {e}")
+    _events_file_handle = None
+    _events_file_path = None
+
+
+def close_log_file() -> None:
+    """Write any queued events and close the events output file.
+
+    If the writer does not finish in time its file handle is left open,
+    since the writer may still be using it.
+    """
+    global _events_writer_thread
+
+    with _events_writer_lock:
+        writer = _events_writer_thread
+        if writer is not None and writer.is_alive():
+            _events_write_queue.put(None)
+            writer.join(timeout=5.0)
+            if writer.is_alive():
+                logger.warning("Events writer did not stop in time; leaving the event file open")
+                return
+        _events_writer_thread = None
+
+    with _events_file_lock:
+        _close_events_file_handle()
+
+
+atexit.register(close_log_file)
+
+
 def _send_to_api(event: Dict[str, Any]) -> None:
     """Send event to API if configured.
 
     Args:
-        event: The event to send
+        event: The event to send, already masked by log_event
     """
     try:
         # Import here to avoid circular import
-        from cylestio_monitor.api_client import send_event_to_api
+        from cylestio_monitor.api_client import send_masked_event_to_api
 
-        send_event_to_api(event)
+        send_masked_event_to_api(event)
     except Exception as e:
         logger.error(f"Failed to send event to API: {e}")
 
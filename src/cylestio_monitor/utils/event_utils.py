@@ -6,6 +6,7 @@ This module provides utilities for event creation and timestamp formatting.
 
 import logging
 import re
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Union
 
@@ -14,6 +15,9 @@ from cylestio_monitor.config import ConfigManager
 logger = logging.getLogger("CylestioMonitor")
 config_manager = ConfigManager()
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS.") for the most recently formatted second
+_second_prefix = (None, "")
+
 
 def get_utc_timestamp() -> datetime:
     """
@@ -113,7 +117,7 @@ def format_timestamp(dt: Optional[Union[datetime, str]] = None) -> str:
         ValueError: If dt is a string but not in a valid ISO-8601 format
     """
     if dt is None:
-        dt = get_utc_timestamp()
+        return _format_current_timestamp()
     elif isinstance(dt, str):
         # Parse string to datetime
         dt = parse_timestamp(dt)
@@ -121,24 +125,25 @@ def format_timestamp(dt: Optional[Union[datetime, str]] = None) -> str:
         # Assume naive datetimes are UTC
         dt = dt.replace(tzinfo=timezone.utc)
 
-    # Ensure microseconds are preserved in the output
-    iso_format = dt.astimezone(timezone.utc).isoformat()
-
-    # If there's no microseconds in the output, add them
-    if '.' not in iso_format:
-        # Find the position before Z or timezone offset
-        if 'Z' in iso_format:
-            pos = iso_format.index('Z')
-            iso_format = iso_format[:pos] + '.000000' + iso_format[pos:]
-        elif '+' in iso_format:
-            pos = iso_format.index('+')
-            iso_format = iso_format[:pos] + '.000000' + iso_format[pos:]
-        elif '-' in iso_format and iso_format.rindex('-') > 10:  # Not the date separator
-            pos = iso_format.rindex('-')
-            iso_format = iso_format[:pos] + '.000000' + iso_format[pos:]
-
-    # Replace +00:00 with Z for UTC
-    return iso_format.replace('+00:00', 'Z')
+    # Format in a single call: always include microseconds and use the Z suffix
+    return dt.astimezone(timezone.utc).replace(tzinfo=None).isoformat(timespec="microseconds") + "Z"
+
+
+def _format_current_timestamp() -> str:
+    """Format the current UTC time the same way as format_timestamp().
+
+    Events are usually emitted many times per second, so the date and time
+    prefix is formatted once per second and reused; only the microseconds
+    are formatted on each call.
+    """
+    global _second_prefix
+
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _second_prefix
+    if cached_second != seconds:
+        prefix = datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.")
+        _second_prefix = (seconds, prefix)
+    return f"{prefix}{nanoseconds // 1000:06d}Z"
 
 
 def create_event_dict(
@@ -6,7 +6,7 @@ including decorators for function monitoring and context managers for spans.
 """
 
 import functools
-import inspect
+import sys
 import time
 from typing import Any, Callable, Dict, Optional, TypeVar, cast
 
@@ -15,6 +15,9 @@ from cylestio_monitor.utils.trace_context import TraceContext
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Frame access without building an inspect.stack(); None on Pythons without it
+_getframe = getattr(sys, "_getframe", None)
+
 
 def instrument_function(func: F, name_prefix: str = "function") -> F:
     """Decorator to instrument a function with telemetry.
@@ -27,17 +30,18 @@ def instrument_function(func: F, name_prefix: str = "function") -> F:
         The wrapped function
     """
 
+    # Get function details; these don't change between calls
+    module_name = func.__module__
+    function_name = func.__qualname__
+    span_name = f"{name_prefix}.{function_name}"
+
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        # Get function details
-        module_name = func.__module__
-        function_name = func.__qualname__
-
         # Start span for this function
-        span_info = TraceContext.start_span(f"{name_prefix}.{function_name}")
+        span_info = TraceContext.start_span(span_name)
 
-        # Get caller information
-        caller_frame = inspect.currentframe().f_back
+        # Get caller information from the frame that called the wrapper
+        caller_frame = _getframe(1) if _getframe is not None else None
         caller_info = {}
         if caller_frame:
             caller_info = {
@@ -11,6 +11,9 @@ from typing import Any, Dict
 
 logger = logging.getLogger("CylestioMonitor")
 
+# Types that are already JSON-native and survive a JSON round trip unchanged
+_JSON_PRIMITIVES = (str, int, float, bool, type(None))
+
 
 class MonitorJSONEncoder(json.JSONEncoder):
     """Extended JSON encoder that handles common AI framework objects."""
@@ -63,6 +66,10 @@ def serialize_for_monitoring(obj: Any) -> Any:
     Returns:
         JSON-serializable representation of the object
     """
+    # Most attribute values are plain scalars; skip the JSON round trip for them
+    if type(obj) in _JSON_PRIMITIVES:
+        return obj
+
     try:
         # Try to convert directly to JSON
         return json.loads(json.dumps(obj, cls=MonitorJSONEncoder))
@@ -10,6 +10,16 @@ from typing import Dict, Optional
 from cylestio_monitor.utils.otel import generate_span_id, generate_trace_id
 
 
+class _ActiveSpan:
+    """Record of an active span, kept with slots since one is made per span."""
+
+    __slots__ = ("name", "parent_span_id")
+
+    def __init__(self, name: str, parent_span_id: Optional[str]):
+        self.name = name
+        self.parent_span_id = parent_span_id
+
+
 class TraceContext:
     """Manages trace context for AI operations telemetry."""
 
@@ -63,10 +73,7 @@ class TraceContext:
         cls._context["current_span_id"] = span_id
 
         # Record the span with its parent relationship
-        cls._context["active_spans"][span_id] = {
-            "name": name,
-            "parent_span_id": parent_span_id,
-        }
+        cls._context["active_spans"][span_id] = _ActiveSpan(name, parent_span_id)
 
         return {
             "span_id": span_id,
@@ -85,8 +92,7 @@ class TraceContext:
         current_span_id = cls._context["current_span_id"]
 
         # Remove from active spans
-        if current_span_id in cls._context["active_spans"]:
-            del cls._context["active_spans"][current_span_id]
+        cls._context["active_spans"].pop(current_span_id, None)
 
         # Pop from stack to get parent
         if cls._context["span_stack"]:
@@ -111,12 +117,9 @@ class TraceContext:
 
         # Add parent_span_id if current span exists and has a parent
         current_span_id = cls._context.get("current_span_id")
-        if current_span_id and current_span_id in cls._context.get("active_spans", {}):
-            parent_span_id = cls._context["active_spans"][current_span_id].get(
-                "parent_span_id"
-            )
-            if parent_span_id:
-                context["parent_span_id"] = parent_span_id
+        span = cls._context.get("active_spans", {}).get(current_span_id) if current_span_id else None
+        if span is not None and span.parent_span_id:
+            context["parent_span_id"] = span.parent_span_id
 
         return context
 
@@ -130,9 +133,8 @@ class TraceContext:
         Returns:
             Optional[str]: The parent span ID, or None if not found
         """
-        if cls._context.get("active_spans") and span_id in cls._context["active_spans"]:
-            return cls._context["active_spans"][span_id].get("parent_span_id")
-        return None
+        span = cls._context.get("active_spans", {}).get(span_id)
+        return span.parent_span_id if span is not None else None
 
     @classmethod
     def reset(cls) -> None:
@@ -1,5 +1,6 @@
 """Pytest configuration file."""
 
+import importlib.util
 import logging
 import os
 import sys
@@ -9,17 +10,27 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 
+# Modules that are replaced with a basic mock when they are not importable.
+# Built once at import time so the session fixture only has to install them.
+_MOCK_MODULES = ("langchain", "langchain_core")
+
+
+def _module_available(module_name):
+    """Return True if the module can be imported without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_mock_imports():
     """Set up simplified mock imports for missing modules."""
-    # Only create minimal mocks for modules that are absolutely essential
-    if "langchain" not in sys.modules:
-        # For MVP, we only need a basic mock of langchain
-        sys.modules["langchain"] = MagicMock()
-
-    if "langchain_core" not in sys.modules:
-        # For MVP, we only need a basic mock of langchain_core
-        sys.modules["langchain_core"] = MagicMock()
+    # For MVP, we only need basic mocks of the langchain packages, and only
+    # when the real package cannot be imported
+    for module_name in _MOCK_MODULES:
+        if module_name not in sys.modules and not _module_available(module_name):
+            sys.modules[module_name] = MagicMock()
 
     yield
 
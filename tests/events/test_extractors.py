@@ -0,0 +1,21 @@
+"""Tests for the default converter's data extractors."""
+
+from cylestio_monitor.events.converters.default.extractors import extract_performance_metrics
+
+
+def test_extract_performance_metrics_maps_token_keys():
+    data = {
+        "latency": 1.5,
+        "input_tokens": 10,
+        "output_tokens": 20,
+        "total_tokens": 30,
+        "usage": {"prompt_tokens": 11, "other": 1},
+        "unrelated": True,
+    }
+
+    assert extract_performance_metrics({}, data) == {
+        "latency": 1.5,
+        "llm.usage.prompt_tokens": 11,
+        "llm.usage.completion_tokens": 20,
+        "llm.usage.total_tokens": 30,
+    }
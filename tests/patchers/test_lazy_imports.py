@@ -0,0 +1,49 @@
+"""
+Tests for lazy loading of patchers from the package namespaces.
+"""
+
+import subprocess
+import sys
+import unittest
+
+import cylestio_monitor
+from cylestio_monitor import patchers
+from cylestio_monitor.patchers import mcp_patcher, openai_patcher
+
+
+class TestLazyPatcherImports(unittest.TestCase):
+    """Test that patchers are importable without being loaded eagerly."""
+
+    def test_package_import_does_not_load_frameworks(self):
+        """Importing cylestio_monitor should not import patchers or the API client."""
+        code = (
+            "import sys, cylestio_monitor; "
+            "print(any(name in sys.modules for name in ("
+            "'cylestio_monitor.patchers.anthropic', "
+            "'cylestio_monitor.patchers.langchain_patcher', "
+            "'cylestio_monitor.patchers.openai_patcher', "
+            "'cylestio_monitor.api_client')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_lazy_attributes_resolve_to_patcher_modules(self):
+        """Lazy names should resolve to the objects defined in their modules."""
+        self.assertIs(patchers.OpenAIPatcher, openai_patcher.OpenAIPatcher)
+        self.assertIs(patchers.patch_mcp, mcp_patcher.patch_mcp)
+        self.assertIs(cylestio_monitor.patch_mcp, mcp_patcher.patch_mcp)
+        self.assertIn("patch_langchain", dir(patchers))
+        self.assertEqual(cylestio_monitor.api_client.__name__, "cylestio_monitor.api_client")
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names should still raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            patchers.not_a_patcher
+        with self.assertRaises(AttributeError):
+            cylestio_monitor.not_a_patcher
+
+
+if __name__ == "__main__":
+    unittest.main()
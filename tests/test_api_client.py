@@ -0,0 +1,123 @@
+"""Tests for the API client module."""
+
+from unittest.mock import MagicMock, patch
+
+from cylestio_monitor import api_client
+
+
+def test_sender_clients_are_reused_per_endpoint():
+    """Test that the background sender reuses one client per endpoint/method."""
+    with patch("cylestio_monitor.api_client.ApiClient") as mock_client_class:
+        first = api_client._get_sender_client("http://a/v1/telemetry", "POST")
+        second = api_client._get_sender_client("http://a/v1/telemetry", "POST")
+        other = api_client._get_sender_client("http://a/v1/telemetry", "PUT")
+
+        assert first is second
+        assert mock_client_class.call_count == 2
+        assert other is mock_client_class.return_value
+
+        # Stopping the sender closes and drops the cached clients
+        api_client.stop_background_thread()
+        assert api_client._sender_clients == {}
+        assert mock_client_class.return_value.close.call_count == 2
+
+
+def test_stop_background_thread_closes_default_client():
+    """Test that stopping the sender closes the default client's session."""
+    client = api_client.ApiClient("http://localhost:8000", "POST")
+    with patch.object(client, "_session") as mock_session:
+        with patch.object(api_client, "_default_client", client):
+            api_client.stop_background_thread()
+            assert api_client._default_client is None
+
+        mock_session.close.assert_called_once_with()
+
+
+def test_send_event_direct_uses_pooled_session():
+    """Test that direct sends go through the client's persistent session."""
+    client = api_client.ApiClient("http://localhost:8000", "POST")
+    with patch.object(client, "_session") as mock_session:
+        mock_session.request.return_value.status_code = 200
+        event = {"name": "test.event"}
+
+        assert client._send_event_direct(client.endpoint, "POST", 5, event)
+        assert client._send_event_direct(client.endpoint, "POST", 5, event)
+
+        assert mock_session.request.call_count == 2
+        method, url = mock_session.request.call_args.args
+        assert (method, url) == ("POST", "http://localhost:8000/v1/telemetry")
+
+
+def test_send_event_direct_rejects_non_http_scheme():
+    """Test that non-HTTP endpoints are refused before any request is made."""
+    client = api_client.ApiClient("http://localhost:8000", "POST")
+    with patch.object(client, "_session") as mock_session:
+        assert not client._send_event_direct("file:///etc/passwd", "POST", 5, {})
+        mock_session.request.assert_not_called()
+
+
+def test_endpoint_scheme_is_parsed_once_per_endpoint():
+    """Test that repeated sends to one endpoint reuse the parsed scheme."""
+    api_client._endpoint_scheme.cache_clear()
+    client = api_client.ApiClient("https://example.com", "POST")
+    with patch.object(client, "_session") as mock_session:
+        mock_session.request.return_value.status_code = 200
+        for _ in range(3):
+            assert client._send_event_direct(client.endpoint, "POST", 5, {})
+
+    info = api_client._endpoint_scheme.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_background_sender_drains_queued_events_in_order():
+    """Test that queued events are drained in batches and all get sent."""
+    sent = []
+    with patch("cylestio_monitor.api_client._get_sender_client") as mock_get_client:
+        mock_get_client.return_value._send_event_direct.side_effect = (
+            lambda endpoint, method, timeout, event: sent.append(event["n"])
+        )
+        for n in range(25):
+            api_client._event_queue.put(("http://a/v1/telemetry", "POST", 5, {"n": n}))
+
+        api_client._ensure_background_thread_running()
+        api_client._event_queue.join()
+        api_client.stop_background_thread()
+
+    assert sent == list(range(25))
+
+
+def test_masked_events_are_not_masked_again():
+    """Test that log_event's already-masked events skip the second masking pass."""
+    settings = api_client._default_client_settings_snapshot()
+    with patch.object(api_client, "_default_client") as mock_client, patch.object(
+        api_client, "_default_client_settings", settings
+    ), patch("cylestio_monitor.api_client.SecurityScanner") as mock_scanner_class:
+        event = {"name": "test.event"}
+        api_client.send_masked_event_to_api(event)
+
+        mock_scanner_class.get_instance.assert_not_called()
+        mock_client.send_event.assert_called_once_with(event)
+
+
+def test_default_client_is_rebuilt_when_settings_change():
+    """Test that the default client follows endpoint and access key changes."""
+    with patch("cylestio_monitor.api_client.ApiClient") as mock_client_class, patch.object(
+        api_client, "_default_client_settings_snapshot", return_value=("a",)
+    ) as mock_settings:
+        first = MagicMock()
+        second = MagicMock()
+        mock_client_class.side_effect = [first, second]
+
+        api_client.send_masked_event_to_api({"n": 1})
+        api_client.send_masked_event_to_api({"n": 2})
+        assert mock_client_class.call_count == 1
+
+        mock_settings.return_value = ("b",)
+        api_client.send_masked_event_to_api({"n": 3})
+
+        assert mock_client_class.call_count == 2
+        first.close.assert_called_once_with()
+        second.send_event.assert_called_once_with({"n": 3})
+
+        api_client.stop_background_thread()
+        second.close.assert_called_once_with()
@@ -120,6 +120,16 @@ def test_get_config_value(mock_config_manager):
     assert value == "default"
 
 
+def test_get_reflects_config_changes(mock_config_manager):
+    """Test that repeated lookups of one key see the current config."""
+    with patch.object(mock_config_manager, "save_config"):
+        mock_config_manager.set("monitoring.events_output_file", "first.json")
+        assert mock_config_manager.get("monitoring.events_output_file") == "first.json"
+
+        mock_config_manager.set("monitoring.events_output_file", "second.json")
+        assert mock_config_manager.get("monitoring.events_output_file") == "second.json"
+
+
 def test_set_config_value(mock_config_manager):
     """Test setting a config value by key."""
     with patch.object(mock_config_manager, "save_config"):
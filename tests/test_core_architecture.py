@@ -50,6 +50,21 @@ class TestTraceContext(unittest.TestCase):
         self.assertIn("trace_id", span_info)
         self.assertIn("name", span_info)
 
+    def test_nested_span_parents(self):
+        """Test parent lookups for nested spans."""
+        TraceContext.initialize_trace("test-agent")
+        outer = TraceContext.start_span("outer")["span_id"]
+        inner = TraceContext.start_span("inner")["span_id"]
+
+        self.assertEqual(TraceContext.get_parent_span_id(inner), outer)
+        self.assertIsNone(TraceContext.get_parent_span_id(outer))
+        self.assertEqual(TraceContext.get_current_context()["parent_span_id"], outer)
+
+        # Ending the inner span forgets it and makes the outer span current
+        self.assertEqual(TraceContext.end_span(), inner)
+        self.assertIsNone(TraceContext.get_parent_span_id(inner))
+        self.assertNotIn("parent_span_id", TraceContext.get_current_context())
+
 
 class TestEventLogging(unittest.TestCase):
     """Test the Event Logging utilities."""
@@ -315,6 +315,65 @@ class TestEventLogging:
         for key, value in attributes.items():
             assert event_dict["attributes"][key] == value
 
+    def test_write_to_log_file_batches_in_background(self):
+        """Test that events are written in order by the background writer."""
+        from cylestio_monitor.utils import event_logging
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            events_file = os.path.join(tmp_dir, "events.json")
+            mock_config = MagicMock()
+            mock_config.get.return_value = events_file
+
+            with patch.object(event_logging, "ConfigManager", return_value=mock_config):
+                for i in range(300):
+                    event_logging._write_to_log_file({"name": f"event-{i}"})
+
+            # Closing drains the queue before the handle is released
+            event_logging.close_log_file()
+            assert event_logging._events_file_handle is None
+            assert event_logging._events_writer_thread is None
+
+            with open(events_file) as f:
+                names = [json.loads(line)["name"] for line in f]
+            assert names == [f"event-{i}" for i in range(300)]
+
+    def test_flush_log_file_waits_for_queued_events(self):
+        """Test that flushing makes every logged event readable from the file."""
+        from cylestio_monitor.utils import event_logging
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            events_file = os.path.join(tmp_dir, "events.json")
+            mock_config = MagicMock()
+            mock_config.get.return_value = events_file
+
+            with patch.object(event_logging, "ConfigManager", return_value=mock_config):
+                for i in range(10):
+                    event_logging._write_to_log_file({"name": f"event-{i}"})
+
+            try:
+                assert event_logging.flush_log_file()
+                with open(events_file) as f:
+                    assert len(f.readlines()) == 10
+            finally:
+                event_logging.close_log_file()
+
+    def test_close_log_file_keeps_handle_while_writer_runs(self):
+        """Test that a writer that fails to stop keeps its file handle."""
+        from cylestio_monitor.utils import event_logging
+
+        writer = MagicMock()
+        writer.is_alive.return_value = True
+        handle = MagicMock()
+        with patch.object(event_logging, "_events_writer_thread", writer), \
+                patch.object(event_logging, "_events_file_handle", handle), \
+                patch.object(event_logging, "_events_write_queue") as mock_queue:
+            event_logging.close_log_file()
+
+            mock_queue.put.assert_called_once_with(None)
+            assert event_logging._events_writer_thread is writer
+            assert event_logging._events_file_handle is handle
+            handle.close.assert_not_called()
+
     @patch("cylestio_monitor.utils.event_logging.log_event")
     def test_log_info(self, mock_log_event):
         """Test log_info function."""
@@ -1,5 +1,6 @@
 """Tests for the OpenAI patcher module."""
 
+import gc
 import logging
 import sys
 import unittest
@@ -218,6 +219,24 @@ class TestOpenAIPatcher(unittest.TestCase):
         self.assertEqual(self.mock_chat_completions.create, self.original_chat_create)
         self.assertEqual(self.mock_completions.create, self.original_completions_create)
 
+    def test_patched_clients_are_tracked_weakly(self):
+        """Test that patched clients are tracked by object and not kept alive."""
+        from cylestio_monitor.patchers import openai_patcher
+
+        self.patcher.patch()
+        self.assertIn(self.client, openai_patcher._patched_clients)
+
+        self.patcher.unpatch()
+        self.assertNotIn(self.client, openai_patcher._patched_clients)
+
+        # A client that is dropped without unpatching leaves no entry behind
+        self.patcher.patch()
+        size = len(openai_patcher._patched_clients)
+        del self.patcher, self.client
+        del self.mock_chat, self.mock_chat_completions, self.mock_completions
+        gc.collect()
+        self.assertEqual(len(openai_patcher._patched_clients), size - 1)
+
 
 @pytest.mark.skipif(not OPENAI_AVAILABLE, reason="OpenAI not available")
 @pytest.mark.skip(reason="Module patching is difficult to test in isolation")
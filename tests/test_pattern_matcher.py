@@ -117,6 +117,51 @@ class TestPatternRegistry:
         matches = registry.scan_text(None)
         assert len(matches) == 0
 
+    def test_prefilter_keeps_all_matches(self):
+        """Test that the union prefilter rejects clean text but keeps every match."""
+        # Use the default patterns
+        mock_manager = MagicMock()
+        mock_manager.get.return_value = {}
+        registry = PatternRegistry(mock_manager)
+        assert registry._prefilter is not None
+
+        # Clean text is rejected without any matches
+        assert registry.scan_text("Nothing sensitive in here") == []
+
+        # Overlapping patterns still each report their own match
+        text = "Key sk-ant-" + "a" * 40 + " and card 4111-1111-1111-1111"
+        pattern_names = {match["pattern_name"] for match in registry.scan_text(text)}
+        assert {"anthropic_api_key", "openai_api_key", "credit_card"} <= pattern_names
+
+    def test_mask_text_in_place(self):
+        """Test masking texts with separate and with overlapping matches."""
+        mock_manager = MagicMock()
+        mock_manager.get.return_value = {}
+        registry = PatternRegistry(mock_manager)
+
+        text = "Mail john.doe@example.com, SSN 123-45-6789, end"
+        assert registry.mask_text_in_place(text) == "Mail j******e@example.com, SSN ***-**-6789, end"
+
+        # The OpenAI and Anthropic key patterns overlap on Anthropic keys
+        masked = registry.mask_text_in_place("key sk-ant-" + "a" * 40 + " done")
+        assert "a" * 40 not in masked
+        assert masked.startswith("key sk-a") and masked.endswith(" done")
+
+        assert registry.mask_text_in_place("Nothing sensitive") == "Nothing sensitive"
+
+    def test_prefilter_skipped_for_backreferences(self):
+        """Test that patterns with backreferences disable the prefilter."""
+        mock_manager = MagicMock()
+        mock_manager.get.return_value = {
+            "repeated": {"regex": r"(ab)\1", "category": "sensitive_data"},
+            "digits": {"regex": r"\d{6}", "category": "sensitive_data"},
+        }
+
+        registry = PatternRegistry(mock_manager)
+
+        assert registry._prefilter is None
+        assert [m["pattern_name"] for m in registry.scan_text("xxabab")] == ["repeated"]
+
     def test_reload_config(self):
         """Test that patterns can be reloaded from config."""
         # Create mock config manager
@@ -0,0 +1,81 @@
+"""Tests for the event processing security helpers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from cylestio_monitor.events.processing import security
+from cylestio_monitor.events.processing.security import (
+    check_security_concerns, mask_sensitive_data)
+
+
+@pytest.fixture
+def keywords():
+    """Use fixed keyword lists instead of the user configuration."""
+    with patch.object(
+        security.config_manager, "get_dangerous_keywords", return_value=["DROP"]
+    ), patch.object(
+        security.config_manager, "get_suspicious_keywords", return_value=["HACK"]
+    ):
+        yield
+
+
+def test_mask_sensitive_keys():
+    """Test that values under sensitive keys are masked."""
+    data = {"api_key": "abcd1234efgh5678", "password": "short"}
+
+    masked = mask_sensitive_data(data)
+
+    assert masked["api_key"] == "abcd********5678"
+    assert masked["password"] == "********"
+    # The original data must not be modified
+    assert data["api_key"] == "abcd1234efgh5678"
+
+
+def test_token_usage_keys_not_masked():
+    """Test that token usage metrics are excluded from key-based masking."""
+    data = {"usage": {"input_tokens": "1234567890", "output_tokens": "42"}}
+
+    masked = mask_sensitive_data(data)
+
+    assert masked["usage"] == {"input_tokens": "1234567890", "output_tokens": "42"}
+
+
+def test_mask_credential_patterns_in_values():
+    """Test that credential formats are masked regardless of the key name."""
+    openai_key = "sk-" + "a" * 24
+    data = {
+        "prompt": f"use {openai_key} please",
+        "headers": ["Bearer abcdefghijklmnop"],
+    }
+
+    masked = mask_sensitive_data(data)
+
+    assert openai_key not in masked["prompt"]
+    assert masked["prompt"].startswith("use sk-a")
+    assert masked["prompt"].endswith("aaaa please")
+    assert masked["headers"] == ["Bear" + "*" * 15 + "mnop"]
+
+
+def test_check_security_concerns_levels(keywords):
+    """Test that dangerous content takes precedence over suspicious content."""
+    assert check_security_concerns({"content": "hello there"}) == "none"
+    assert check_security_concerns({"content": "how to hack"}) == "suspicious"
+    assert (
+        check_security_concerns(
+            {"messages": [{"content": "hack it"}, {"content": "drop  table"}]}
+        )
+        == "suspicious"
+    )
+    assert check_security_concerns({"note": "hack", "content": "drop it"}) == "dangerous"
+
+
+def test_contains_keywords_match_literally():
+    """Test that keywords with regex metacharacters are matched literally."""
+    with patch.object(
+        security.config_manager, "get_dangerous_keywords", return_value=["EXEC(", "RM -RF"]
+    ), patch.object(security.config_manager, "get_suspicious_keywords", return_value=[]):
+        assert security.contains_dangerous("please exec(code)")
+        assert security.contains_dangerous("rm   -rf /")
+        assert not security.contains_dangerous("execute the plan")
+        assert not security.contains_suspicious("anything at all")
@@ -66,6 +66,27 @@ class TestSecurityScanner:
         for i in range(1, 10):
             assert scanners[0] is scanners[i]
 
+    def test_existing_instance_is_returned_without_locking(self):
+        """Test that lookups after initialization skip the init lock."""
+        scanner = SecurityScanner.get_instance()
+
+        with patch.object(SecurityScanner, "_init_lock") as mock_lock:
+            assert SecurityScanner.get_instance() is scanner
+            mock_lock.__enter__.assert_not_called()
+
+    def test_instance_published_after_initialization(self):
+        """Test that a failed initialization does not publish the instance."""
+        # Reset the singleton for testing
+        SecurityScanner._instance = None
+        SecurityScanner._is_initialized = False
+
+        with patch.object(SecurityScanner, "_initialize", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                SecurityScanner.get_instance()
+        assert SecurityScanner._instance is None
+
+        SecurityScanner._is_initialized = False
+
     def test_scan_text_sensitive(self):
         """Test scanning text with sensitive data."""
         # Reset the singleton for testing
@@ -139,6 +160,22 @@ class TestSecurityScanner:
         # Test with empty text
         assert scanner.scan_text("")["alert_level"] == "none"
 
+    def test_empty_scan_results_are_independent(self):
+        """Test that empty scan results never share mutable state."""
+        scanner = SecurityScanner.get_instance()
+
+        first = scanner.scan_text("")
+        first["keywords"].append("mutated")
+        first["category"] = "mutated"
+
+        assert scanner.scan_event(None) == {
+            "alert_level": "none",
+            "category": None,
+            "severity": None,
+            "description": None,
+            "keywords": [],
+        }
+
     def test_case_sensitivity(self):
         """Test case sensitivity handling, especially for dangerous commands."""
         # Reset the singleton for testing
@@ -209,6 +246,67 @@ class TestSecurityScanner:
         assert scanner.scan_text("hack!")["alert_level"] == "suspicious"
         assert scanner.scan_text("hack.")["alert_level"] == "suspicious"
 
+    def test_sensitive_keyword_gate(self):
+        """Test that the keyword union agrees with per-keyword matching."""
+        # Reset the singleton for testing
+        SecurityScanner._instance = None
+        SecurityScanner._is_initialized = False
+
+        mock_manager = MagicMock()
+        mock_manager.get.side_effect = lambda key, default=None: {
+            "security.keywords.sensitive_data": ["password", "credit card", "ssn"],
+            "security.keywords.dangerous_commands": ["rm -rf"],
+            "security.keywords.prompt_manipulation": ["jailbreak"]
+        }.get(key, default)
+        scanner = SecurityScanner(mock_manager)
+
+        for text in ["my password is", "credit card number", "ssn:", "passwords", "no secrets here"]:
+            expected = any(
+                scanner._word_boundary_match(keyword, text)
+                for keyword in scanner._sensitive_data_keywords
+            )
+            assert scanner._sensitive_data_keywords_present(text) == expected
+
+        assert "ssn" in scanner.scan_text("My SSN is private")["keywords"]
+        assert scanner.scan_text("Plain text")["alert_level"] == "none"
+
+        # Replacing the keyword set rebuilds the union
+        scanner._sensitive_data_keywords = {"passport"}
+        assert scanner._sensitive_data_keywords_present("my passport")
+        assert not scanner._sensitive_data_keywords_present("my password")
+
+        SecurityScanner._instance = None
+        SecurityScanner._is_initialized = False
+
+    def test_keyword_prescan_skips_absent_keywords(self):
+        """Test that keywords absent from the text never reach the full match."""
+        # Reset the singleton for testing
+        SecurityScanner._instance = None
+        SecurityScanner._is_initialized = False
+
+        mock_manager = MagicMock()
+        mock_manager.get.side_effect = lambda key, default=None: {
+            "security.keywords.sensitive_data": ["password"],
+            "security.keywords.dangerous_commands": ["rm -rf", "DROP"],
+            "security.keywords.prompt_manipulation": ["ignore previous instructions", "REMOVE"]
+        }.get(key, default)
+        scanner = SecurityScanner(mock_manager)
+
+        with patch.object(scanner, "_simple_text_match", wraps=scanner._simple_text_match) as simple_match:
+            assert scanner.scan_text("Nothing interesting here")["alert_level"] == "none"
+            simple_match.assert_not_called()
+
+            result = scanner.scan_text("please run RM -RF now")
+            assert {call.args[0].lower() for call in simple_match.call_args_list} == {"rm -rf"}
+            assert result["category"] == "dangerous_commands"
+
+        # Mixed case input still matches lowercase and uppercase keywords
+        assert "remove" in scanner.scan_text("REMOVE all guards")["keywords"]
+        assert scanner.scan_text("Please IGNORE PREVIOUS INSTRUCTIONS")["category"] == "prompt_manipulation"
+
+        SecurityScanner._instance = None
+        SecurityScanner._is_initialized = False
+
     def test_alert_categories(self):
         """Test the new alert categories structure and severity levels."""
         # Reset the singleton for testing
@@ -808,6 +906,22 @@ class TestSecurityScanner:
         masked_normal = scanner.mask_event(normal_event)
         assert masked_normal["content"] == normal_event["content"]
 
+    def test_mask_message_contents_scans_each_message_once(self):
+        """Test that message masking scans each message a single time."""
+        scanner = SecurityScanner.get_instance()
+        messages = [
+            {"content": "card 8989-8989-8989-8989"},
+            {"content": "nothing to hide"},
+            "not a dict",
+        ]
+
+        with patch.object(scanner._pattern_registry, "scan_text", wraps=scanner._pattern_registry.scan_text) as scan:
+            scanner._mask_message_contents(messages)
+            assert scan.call_count == 2
+
+        assert "8989-8989-8989-8989" not in messages[0]["content"]
+        assert messages[1] == {"content": "nothing to hide"}
+
     def test_mask_all_langgraph_event_types(self):
         """Test masking sensitive data in all LangGraph event types."""
         # Get the scanner instance
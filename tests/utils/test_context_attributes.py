@@ -0,0 +1,20 @@
+"""Tests for the context attributes module."""
+
+import platform
+from unittest.mock import patch
+
+from cylestio_monitor.utils.context_attributes import get_environment_context
+
+
+def test_environment_context_is_collected_once():
+    """Test that environment lookups are cached and callers get a copy."""
+    first = get_environment_context()
+    assert first["os.type"] == platform.system()
+
+    with patch("cylestio_monitor.utils.context_attributes.platform.system") as mock_system:
+        first["os.type"] = "changed"
+        second = get_environment_context()
+        mock_system.assert_not_called()
+
+    assert second["os.type"] == platform.system()
+    assert second is not first
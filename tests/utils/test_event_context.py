@@ -38,6 +38,24 @@ class TestEventContext(unittest.TestCase):
         self.assertIn("process.id", _global_context)
         self.assertEqual(_global_context["process.id"], os.getpid())
 
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_process_id_refreshed_after_fork(self):
+        """Test that a forked child reports its own process ID."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, str(get_context()["process.id"]).encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as reader:
+            child_reported = int(reader.read())
+        os.waitpid(pid, 0)
+
+        self.assertEqual(child_reported, pid)
+        self.assertEqual(_global_context["process.id"], os.getpid())
+
     def test_set_and_get_context(self):
         """Test setting and getting context values."""
         # Set context value
@@ -119,6 +137,20 @@ class TestEventContext(unittest.TestCase):
         self.assertIn("custom.attr", enriched["attributes"])
         self.assertEqual(enriched["attributes"]["custom.attr"], "value")
 
+    def test_enrich_event_matches_merged_context(self):
+        """Test that enrichment adds exactly the merged context, in order."""
+        set_context("user.id", "test-user")
+        set_context("host.name", "thread-host")
+
+        event = {"attributes": {"custom.attr": "value", "os.type": "event-os"}}
+        enriched = enrich_event_with_context(event)
+
+        expected = {"custom.attr": "value", "os.type": "event-os"}
+        for key, value in get_context().items():
+            expected.setdefault(key, value)
+        self.assertEqual(list(enriched["attributes"].items()), list(expected.items()))
+        self.assertEqual(enriched["attributes"]["host.name"], "thread-host")
+
     def test_enrich_event_with_no_attributes(self):
         """Test enriching events that have no attributes."""
         # Set up context
@@ -5,6 +5,7 @@ Tests for the event utilities.
 import pytest
 from datetime import datetime, timezone, timedelta
 import re
+from unittest.mock import patch
 
 from cylestio_monitor.utils.event_utils import (
     get_utc_timestamp,
@@ -32,6 +33,15 @@ class TestTimestampUtilities:
         assert re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z$', result)
         assert result.endswith('Z')
 
+    def test_format_timestamp_none_reuses_second_prefix(self):
+        """Test that current-time formatting matches datetime formatting across seconds."""
+        for ns in (1694788245_000000000, 1694788245_123456789, 1694788246_000001000):
+            with patch("cylestio_monitor.utils.event_utils.time.time_ns", return_value=ns):
+                result = format_timestamp()
+            expected = datetime.fromtimestamp(ns // 1000 / 1e6, timezone.utc)
+            assert result == format_timestamp(expected)
+        assert result == '2023-09-15T14:30:46.000001Z'
+
     def test_format_timestamp_datetime(self):
         """Test formatting with a datetime input."""
         dt = datetime(2023, 9, 15, 14, 30, 45, 123456, tzinfo=timezone.utc)
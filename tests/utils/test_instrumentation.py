@@ -0,0 +1,23 @@
+"""Tests for the instrumentation utilities."""
+
+from unittest.mock import patch
+
+from cylestio_monitor.utils.instrumentation import instrument_function
+
+
+def test_instrument_function_reports_caller():
+    """Test that the start event names the function and its direct caller."""
+
+    def add(a, b):
+        return a + b
+
+    wrapped = instrument_function(add)
+
+    with patch("cylestio_monitor.utils.instrumentation.log_event") as mock_log_event:
+        assert wrapped(2, 3) == 5
+
+    start_attributes = mock_log_event.call_args_list[0].kwargs["attributes"]
+    assert start_attributes["function.name"] == add.__qualname__
+    assert start_attributes["caller.function"] == "test_instrument_function_reports_caller"
+    assert start_attributes["caller.file"] == __file__
+    assert mock_log_event.call_args_list[1].kwargs["attributes"]["function.status"] == "success"
@@ -0,0 +1,33 @@
+"""Test serialization helpers."""
+
+import datetime
+import unittest
+
+from cylestio_monitor.utils.serialization import (safe_event_serialize,
+                                                  serialize_for_monitoring)
+
+
+class TestSerialization(unittest.TestCase):
+    """Test case for serialization module."""
+
+    def test_primitives_returned_unchanged(self):
+        """Test that JSON primitives are passed through as-is."""
+        for value in ("text", 42, 1.5, True, None):
+            self.assertIs(serialize_for_monitoring(value), value)
+
+    def test_containers_are_json_normalized(self):
+        """Test that containers are converted to JSON-compatible values."""
+        result = serialize_for_monitoring({"items": (1, 2), 3: {"a"}})
+        self.assertEqual(result, {"items": [1, 2], "3": ["a"]})
+
+    def test_special_types(self):
+        """Test datetime and bytes handling."""
+        dt = datetime.datetime(2024, 1, 2, 3, 4, 5)
+        self.assertEqual(serialize_for_monitoring(dt), "2024-01-02T03:04:05")
+        self.assertEqual(serialize_for_monitoring(b"abc"), "abc")
+
+    def test_safe_event_serialize(self):
+        """Test serializing an attributes dictionary."""
+        attributes = {"llm.model": "claude", "llm.usage": {"input_tokens": 3}}
+        self.assertEqual(safe_event_serialize(attributes), attributes)
+        self.assertEqual(safe_event_serialize({}), {})